@@ -0,0 +1,97 @@
+"""Cold-start regression benchmark for the nf CLI.
+
+Runs each command in a fresh interpreter against a throwaway HOME and fails
+(exit status 1) if the best wall-clock time exceeds its budget, or if the
+command imports modules it has no business loading at startup.
+
+    python benchmarks/cold_start.py [--repeat N] [--scale X]
+
+--scale (or FOUNDRY_BENCH_SCALE) multiplies every budget, for slow machines.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Best-of-N wall-clock budgets in seconds
+BUDGETS = {
+    "--version": 0.15,
+    "status": 0.30,
+}
+
+# Modules that must stay unimported; a prefix also covers its submodules
+FORBIDDEN = {
+    "--version": ["rich", "numpy", "foundry.tracks", "concurrent.futures.process", "multiprocessing"],
+    "status": ["numpy", "foundry.tracks", "rich.markdown", "rich.live"],
+}
+
+
+def _run(args: list[str], env: dict, importtime: bool = False) -> subprocess.CompletedProcess:
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-m", "foundry", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def imported_modules(command: str, env: dict) -> set[str]:
+    """Modules a command imports, from -X importtime output."""
+    result = _run([command], env, importtime=True)
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def best_time(command: str, env: dict, repeat: int) -> float:
+    """Best wall-clock time of a command over several runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run([command], env)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=float(os.environ.get("FOUNDRY_BENCH_SCALE", "1")))
+    args = parser.parse_args()
+
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    failures = []
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, "HOME": home, "PYTHONPATH": repo}
+        for command, budget in BUDGETS.items():
+            budget *= args.scale
+            _run([command], env)  # warm the OS page cache and bytecode
+            elapsed = best_time(command, env, args.repeat)
+            modules = imported_modules(command, env)
+            leaked = sorted(
+                m for m in modules
+                if any(m == f or m.startswith(f + ".") for f in FORBIDDEN[command])
+            )
+
+            ok = elapsed <= budget and not leaked
+            print(f"nf {command:<10} {elapsed * 1000:7.1f} ms  (budget {budget * 1000:.0f} ms)  "
+                  f"{'ok' if ok else 'FAIL'}")
+            if elapsed > budget:
+                failures.append(f"nf {command} took {elapsed * 1000:.1f} ms")
+            if leaked:
+                failures.append(f"nf {command} imported {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"  {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,24 @@
 """Main CLI entry point for Claude Foundry."""
 
+from pathlib import Path
+
 import click
-from rich.console import Console
 
 from foundry import __version__
 from foundry.engine.state import GameState
 
-# Import tracks to register them
-import foundry.tracks  # noqa: F401
-
 from foundry.engine.runner import (
     start_mission,
     check_mission,
     complete_mission,
+    watch_mission,
+    grade_cohort,
+    provision_cohort,
+    serve_grading,
     list_missions,
     list_tracks,
 )
-from foundry.ui.display import show_welcome, show_status
-
-console = Console()
+from foundry.ui.display import show_welcome, show_status, show_leaderboard
 
 
 @click.group(invoke_without_command=True)
@@ -40,6 +40,14 @@ def status(ctx):
     show_status(ctx.obj["state"])
 
 
+@cli.command()
+@click.option("--limit", "-n", default=10, help="Number of players to show")
+@click.option("--mission", "-m", default=None, help="Only players who completed this mission")
+def leaderboard(limit, mission):
+    """Show the top players by XP."""
+    show_leaderboard(GameState.leaderboard(limit, mission))
+
+
 @cli.command()
 @click.option("--track", "-t", default=None, help="Filter by track")
 @click.pass_context
@@ -54,28 +62,106 @@ def tracks():
     list_tracks()
 
 
+def _parse_params(ctx, param, values):
+    params = {}
+    for item in values:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise click.BadParameter(f"expected KEY=VALUE, got {item!r}")
+        params[key] = value
+    return params
+
+
 @cli.command()
 @click.argument("mission_id")
+@click.option("--param", "params", multiple=True, callback=_parse_params, metavar="KEY=VALUE",
+              help="Override a dataset parameter (repeatable)")
 @click.pass_context
-def play(ctx, mission_id):
+def play(ctx, mission_id, params):
     """Start a mission and set up its workspace."""
-    start_mission(ctx.obj["state"], mission_id)
+    start_mission(ctx.obj["state"], mission_id, params)
 
 
 @cli.command()
 @click.argument("mission_id")
+@click.option("--workers", "-j", type=int, default=None, help="Checkpoints to validate in parallel")
+@click.option("--no-cache", is_flag=True, help="Ignore cached verdicts and script runs")
+@click.option("--run", is_flag=True, help="Execute the learner script in a sandbox before validating")
 @click.pass_context
-def check(ctx, mission_id):
+def check(ctx, mission_id, workers, no_cache, run):
     """Check progress on a mission."""
-    check_mission(ctx.obj["state"], mission_id)
+    check_mission(ctx.obj["state"], mission_id, workers=workers, use_cache=not no_cache, run=run)
+
+
+@cli.command()
+@click.argument("mission_id")
+@click.option("--workers", "-j", type=int, default=None, help="Checkpoints to validate in parallel")
+@click.pass_context
+def watch(ctx, mission_id, workers):
+    """Re-check a mission automatically as you edit its files."""
+    watch_mission(ctx.obj["state"], mission_id, workers=workers)
 
 
 @cli.command(name="complete")
 @click.argument("mission_id")
+@click.option("--workers", "-j", type=int, default=None, help="Checkpoints to validate in parallel")
+@click.option("--no-cache", is_flag=True, help="Ignore cached verdicts and script runs")
+@click.option("--run", is_flag=True, help="Execute the learner script in a sandbox before validating")
 @click.pass_context
-def complete_cmd(ctx, mission_id):
+def complete_cmd(ctx, mission_id, workers, no_cache, run):
     """Complete a mission and claim rewards."""
-    complete_mission(ctx.obj["state"], mission_id)
+    complete_mission(ctx.obj["state"], mission_id, workers=workers, use_cache=not no_cache, run=run)
+
+
+@cli.command()
+@click.option("--root", "-r", required=True,
+              type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Directory tree containing learner workspaces")
+@click.option("--output", "-o", default="-", help="Write rows to this file (default: stdout)")
+@click.option("--format", "fmt", type=click.Choice(["jsonl", "csv"]), default=None,
+              help="Row format (default: from the output extension, else jsonl)")
+@click.option("--workers", "-j", type=int, default=None, help="Grading processes")
+@click.option("--no-cache", is_flag=True, help="Ignore cached verdicts and script runs")
+@click.option("--run", is_flag=True, help="Execute the learner script in a sandbox before validating")
+@click.option("--cohort-seed", type=int, default=None,
+              help="Require each workspace to hold its student's variant from nf provision")
+def grade(root, output, fmt, workers, no_cache, run, cohort_seed):
+    """Grade every mission workspace under a directory."""
+    grade_cohort(root, output, fmt, workers=workers, use_cache=not no_cache, run=run,
+                 cohort_seed=cohort_seed)
+
+
+@cli.command()
+@click.argument("mission_id")
+@click.argument("players", nargs=-1)
+@click.option("--players-file", type=click.File(), default=None,
+              help="Read player names from this file, one per line ('-' for stdin)")
+@click.option("--root", "-r", required=True,
+              type=click.Path(file_okay=False, path_type=Path),
+              help="Directory to create root/<player>/<mission> workspaces in")
+@click.option("--cohort-seed", type=int, required=True, help="Seed every learner's variant derives from")
+@click.option("--param", "params", multiple=True, callback=_parse_params, metavar="KEY=VALUE",
+              help="Override a dataset parameter for the whole cohort (repeatable)")
+@click.option("--workers", "-j", type=int, default=None, help="Workspaces to set up in parallel")
+def provision(mission_id, players, players_file, root, cohort_seed, params, workers):
+    """Set up a mission for many learners, each with their own dataset variant."""
+    players = list(players)
+    if players_file:
+        players += [line.strip() for line in players_file if line.strip()]
+    if not provision_cohort(mission_id, players, root, cohort_seed, params, workers):
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to bind")
+@click.option("--port", "-p", type=int, default=8765, show_default=True, help="TCP port")
+@click.option("--socket", "socket_path", default=None, help="Serve on a Unix socket instead of TCP")
+@click.option("--workers", "-j", type=int, default=None, help="Grading processes")
+@click.option("--no-cache", is_flag=True, help="Ignore cached verdicts and script runs")
+@click.option("--run", is_flag=True, help="Execute the learner script in a sandbox before validating")
+def serve(host, port, socket_path, workers, no_cache, run):
+    """Run a local grading service (HTTP, JSON verdicts)."""
+    serve_grading(host, port, socket_path, workers=workers, use_cache=not no_cache, run=run)
 
 
 def main():
@@ -10,12 +10,16 @@ from foundry.engine.base import (
     get_mission,
     get_all_missions,
     get_missions_for_tier,
+    get_all_mission_info,
 )
 from foundry.engine.state import GameState
+from foundry.engine.workspace import WorkspaceSnapshot
+from foundry.engine.executor import validate_checkpoints
 from foundry.engine.runner import (
     start_mission,
     check_mission,
     complete_mission,
+    watch_mission,
     list_missions,
 )
 
@@ -32,9 +36,13 @@ __all__ = [
     "get_mission",
     "get_all_missions",
     "get_missions_for_tier",
+    "get_all_mission_info",
     "GameState",
+    "WorkspaceSnapshot",
+    "validate_checkpoints",
     "start_mission",
     "check_mission",
     "complete_mission",
+    "watch_mission",
     "list_missions",
 ]
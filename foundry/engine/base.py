@@ -1,5 +1,7 @@
 """Base classes for mission framework - domain agnostic."""
 
+import fnmatch
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -7,6 +9,7 @@ from pathlib import Path
 from typing import Callable
 
 from foundry.engine.tiers import Tier
+from foundry.engine.workspace import WorkspaceSnapshot
 
 
 class CheckpointStatus(Enum):
@@ -25,6 +28,14 @@ class Checkpoint:
     hint: str
     validator: Callable[[], bool] | None = None
     status: CheckpointStatus = CheckpointStatus.LOCKED
+    inputs: list[str] = field(default_factory=list)  # Workspace globs the validator reads
+
+    def depends_on(self, path: str) -> bool:
+        """Whether a workspace-relative path is one of this checkpoint's inputs.
+        Checkpoints without declared inputs depend on the whole workspace."""
+        if not self.inputs:
+            return True
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.inputs)
 
 
 @dataclass
@@ -47,6 +58,22 @@ class Mission(ABC):
 
     info: MissionInfo
     workspace: Path | None = None
+    snapshot: WorkspaceSnapshot | None = None
+
+    # Learner script run by --run, and the files it must (re)produce
+    script: str | None = None
+    outputs: tuple[str, ...] = ()
+
+    # Bump when build_dataset's output changes, so stored copies are rebuilt
+    dataset_version: int = 1
+
+    # Generator parameters and their defaults (override with `nf play --param`)
+    dataset_params: dict = {}
+    params: dict | None = None
+
+    # Whether install_dataset shares the data through the dataset store; off
+    # for one-off variants that no other workspace will reuse
+    share_dataset: bool = True
 
     @abstractmethod
     def setup(self, workspace: Path) -> None:
@@ -71,6 +98,59 @@ class Mission(ABC):
         """Return mission instructions/briefing."""
         pass
 
+    def get_params(self) -> dict:
+        """Dataset parameters in effect: the defaults plus any overrides."""
+        return {**self.dataset_params, **(self.params or {})}
+
+    def set_params(self, overrides: dict[str, str]) -> None:
+        """
+        Apply KEY=VALUE overrides, converting each value to the type of its default.
+        Raises ValueError for unknown keys, unconvertible values or values the
+        mission rejects (see check_params).
+        """
+        params = {}
+        for key, value in overrides.items():
+            if key not in self.dataset_params:
+                known = ", ".join(self.dataset_params) or "none"
+                raise ValueError(f"Unknown parameter {key!r} (known: {known})")
+            default = self.dataset_params[key]
+            if isinstance(default, bool):
+                params[key] = value.lower() in ("1", "true", "yes", "on")
+            else:
+                try:
+                    params[key] = type(default)(value)
+                except ValueError:
+                    raise ValueError(f"{key} must be {type(default).__name__}, got {value!r}") from None
+        self.check_params({**self.dataset_params, **params})
+        self.params = params
+
+    def check_params(self, params: dict) -> None:
+        """Raise ValueError if the dataset parameters in effect are out of range."""
+
+    def build_dataset(self, data_dir: Path) -> None:
+        """Write the mission's generated data files into data_dir."""
+
+    def install_dataset(self, data_dir: Path) -> None:
+        """Populate data_dir from the shared dataset store, generating on first use."""
+        from foundry.engine.datasets import DatasetStore, build_in_place
+
+        if not self.share_dataset:
+            build_in_place(self.build_dataset, data_dir)
+            return
+        try:
+            DatasetStore().install(
+                self.info.id, self.dataset_version, self.get_params(), self.build_dataset, data_dir
+            )
+        except OSError:
+            # Store unusable (e.g. read-only save directory): generate in place
+            build_in_place(self.build_dataset, data_dir)
+
+    def get_snapshot(self) -> WorkspaceSnapshot:
+        """Get the workspace snapshot for the current check pass."""
+        if self.snapshot is None or self.snapshot.root != self.workspace:
+            self.snapshot = WorkspaceSnapshot(self.workspace)
+        return self.snapshot
+
     def get_current_checkpoint(self) -> Checkpoint | None:
         """Get the first non-completed checkpoint."""
         for cp in self.get_checkpoints():
@@ -107,26 +187,60 @@ def register_mission(mission_class: type[Mission]) -> type[Mission]:
     return mission_class
 
 
+def _manifest() -> dict:
+    from foundry.engine.manifest import load_manifest
+
+    return load_manifest()
+
+
 def get_mission(mission_id: str) -> type[Mission] | None:
-    """Get a mission class by ID."""
+    """Get a mission class by ID, importing its module on first use."""
+    if mission_id not in _missions:
+        entry = _manifest()["missions"].get(mission_id)
+        if entry:
+            importlib.import_module(entry["module"])
     return _missions.get(mission_id)
 
 
 def get_all_missions() -> dict[str, type[Mission]]:
-    """Get all registered missions."""
+    """Get all missions, importing any modules not loaded yet."""
+    for mission_id in _manifest()["missions"]:
+        get_mission(mission_id)
     return _missions.copy()
 
 
 def get_missions_for_tier(tier: Tier) -> list[type[Mission]]:
     """Get all missions for a specific tier."""
-    return [m for m in _missions.values() if m.info.tier == tier]
+    return [m for m in get_all_missions().values() if m.info.tier == tier]
 
 
 def get_missions_for_track(track_id: str) -> list[type[Mission]]:
     """Get all missions for a specific track."""
-    return [m for m in _missions.values() if m.info.track == track_id]
+    return [m for m in get_all_missions().values() if m.info.track == track_id]
+
+
+def get_all_mission_info() -> dict[str, MissionInfo]:
+    """Get metadata for all missions without importing their modules."""
+    from foundry.engine.manifest import info_from_dict
+
+    missions = {
+        mission_id: info_from_dict(entry["info"])
+        for mission_id, entry in _manifest()["missions"].items()
+    }
+    missions.update({mission_id: m.info for mission_id, m in _missions.items()})
+    return missions
+
+
+def get_mission_info_for_tier(tier: Tier) -> list[MissionInfo]:
+    """Get metadata for all missions of a specific tier, without importing them."""
+    return [info for info in get_all_mission_info().values() if info.tier == tier]
+
+
+def get_mission_info_for_track(track_id: str) -> list[MissionInfo]:
+    """Get metadata for all missions of a specific track, without importing them."""
+    return [info for info in get_all_mission_info().values() if info.track == track_id]
 
 
 def get_all_tracks() -> dict[str, dict]:
     """Get all registered tracks."""
-    return _tracks.copy()
+    return {**_manifest()["tracks"], **_tracks}
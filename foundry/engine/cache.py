@@ -0,0 +1,289 @@
+"""Persistent caches for checkpoint verdicts and learner script runs."""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from foundry import __version__
+from foundry.engine.base import Mission, Checkpoint
+from foundry.engine.state import SAVE_DIR
+
+CACHE_DIR = SAVE_DIR / "cache"
+VERDICT_DIR = CACHE_DIR / "verdicts"
+RUN_DIR = CACHE_DIR / "runs"
+
+# Total size of cached script runs before the least recently used are evicted
+RUN_CACHE_MB = int(os.environ.get("FOUNDRY_RUN_CACHE_MB", 512))
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = 1
+
+_HASH_CHUNK = 1 << 20
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VerdictCache:
+    """
+    Checkpoint verdicts for one mission workspace.
+
+    Each verdict is keyed by the checkpoint id, the mission's dataset
+    parameters and a digest of the (mtime, size, hash) fingerprints of the
+    files matching its declared inputs, so a file appearing or disappearing changes the key too. File
+    hashes are only recomputed when a file's mtime or size changes.
+    """
+
+    def __init__(self, mission: Mission, workspace: Path):
+        self.mission = mission
+        self.workspace = workspace
+        tag = hashlib.sha256(str(workspace.resolve()).encode()).hexdigest()[:12]
+        self.path = VERDICT_DIR / f"{mission.info.id}-{tag}.json"
+        self._files: dict[str, list] = {}
+        self._verdicts: dict[str, dict] = {}
+        self._seen: set[str] = set()
+        self._listing: list[str] | None = None
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("format") != CACHE_FORMAT:
+            return
+        self._files = data.get("files", {})
+        self._verdicts = data.get("verdicts", {})
+
+    def _mission_stamp(self) -> str:
+        """Identify the validator code so edits to a mission invalidate its verdicts."""
+        try:
+            source = Path(sys.modules[type(self.mission).__module__].__file__)
+            return f"{__version__}:{source.stat().st_mtime_ns}"
+        except (OSError, KeyError, TypeError):
+            return __version__
+
+    def fingerprint_file(self, rel: str) -> list:
+        """Return [mtime_ns, size, sha256] for a workspace file, reusing the stored hash."""
+        stat = (self.workspace / rel).stat()
+        self._seen.add(rel)
+        cached = self._files.get(rel)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached
+        entry = [stat.st_mtime_ns, stat.st_size, hash_file(self.workspace / rel)]
+        self._files[rel] = entry
+        self._dirty = True
+        return entry
+
+    def dependencies(self, checkpoint: Checkpoint) -> list[str]:
+        """Workspace files matching a checkpoint's declared inputs."""
+        if self._listing is None:
+            files = []
+            for root, _, names in os.walk(self.workspace):
+                for name in names:
+                    files.append(os.path.relpath(os.path.join(root, name), self.workspace))
+            self._listing = sorted(files)
+        return [rel for rel in self._listing if checkpoint.depends_on(rel)]
+
+    def key(self, checkpoint: Checkpoint) -> str:
+        """Digest of everything a checkpoint's verdict depends on."""
+        digest = hashlib.sha256(self._mission_stamp().encode())
+        digest.update(checkpoint.id.encode())
+        # Validators check against the workspace's dataset variant
+        digest.update(json.dumps(self.mission.get_params(), sort_keys=True).encode())
+        for rel in self.dependencies(checkpoint):
+            try:
+                fingerprint = self.fingerprint_file(rel)
+            except OSError:
+                continue
+            digest.update(f"\0{rel}\0{fingerprint[2]}".encode())
+        return digest.hexdigest()
+
+    def get(self, checkpoint: Checkpoint, key: str) -> tuple[bool, str] | None:
+        """Return the cached verdict for a checkpoint, if its inputs are unchanged."""
+        entry = self._verdicts.get(checkpoint.id)
+        if entry and entry["key"] == key:
+            return entry["success"], entry["message"]
+        return None
+
+    def put(self, checkpoint: Checkpoint, key: str, verdict: tuple[bool, str]) -> None:
+        """Store a freshly computed verdict."""
+        success, message = verdict
+        self._verdicts[checkpoint.id] = {"key": key, "success": success, "message": message}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed."""
+        if self._seen and self._seen != self._files.keys():
+            # Forget fingerprints of files that no longer exist
+            self._files = {rel: fp for rel, fp in self._files.items() if rel in self._seen}
+            self._dirty = True
+        if not self._dirty:
+            return
+        data = {"format": CACHE_FORMAT, "files": self._files, "verdicts": self._verdicts}
+        try:
+            VERDICT_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+@functools.cache
+def _environment_stamp() -> str:
+    """The interpreter and the package versions a learner script may depend on."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = [sys.executable, sys.version]
+    for name in ("numpy", "torch", "artlib"):
+        try:
+            parts.append(f"{name}={version(name)}")
+        except PackageNotFoundError:
+            parts.append(f"{name}=")
+    return "\n".join(parts)
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def evict_lru(root: Path, max_bytes: int) -> None:
+    """
+    Delete the least recently used entries (directories, by mtime) under root
+    until their total size fits in max_bytes. Dot-prefixed in-progress
+    entries are left alone.
+    """
+    entries = []
+    total = 0
+    try:
+        children = list(root.iterdir())
+    except OSError:
+        return
+    for entry in children:
+        if entry.name.startswith("."):
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        size = _tree_size(entry)
+        entries.append((mtime, size, entry))
+        total += size
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+
+class RunCache:
+    """
+    Content-addressed outcomes of learner script runs.
+
+    A run is keyed by the hashes of every workspace file except the script's
+    own outputs, the script name, the resource limits and the interpreter
+    and package versions. Each entry is a directory holding meta.json (the
+    execution result) and copies of the outputs the run produced; a hit
+    copies those back into the workspace instead of running the script.
+    Entries are evicted least recently used first once the cache exceeds
+    max_bytes; a hit refreshes the entry's mtime.
+    """
+
+    def __init__(self, root: Path = RUN_DIR, max_bytes: int = RUN_CACHE_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        workspace: Path,
+        script: str,
+        outputs: tuple[str, ...],
+        limits: str,
+        fingerprints: VerdictCache | None = None,
+    ) -> str:
+        """
+        Digest of everything a run's outcome depends on. Given the workspace's
+        VerdictCache, file hashes come from its (mtime, size) memo, so large
+        unchanged data files are not re-read on every run.
+        """
+        digest = hashlib.sha256(f"{CACHE_FORMAT}\0{_environment_stamp()}\0{script}\0{limits}".encode())
+        files = []
+        for root, dirnames, names in os.walk(workspace):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "__pycache__"]
+            for name in names:
+                rel = os.path.relpath(os.path.join(root, name), workspace)
+                if rel not in outputs and not name.startswith("."):
+                    files.append(rel)
+        for rel in sorted(files):
+            try:
+                if fingerprints is not None:
+                    file_hash = fingerprints.fingerprint_file(rel)[2]
+                else:
+                    file_hash = hash_file(workspace / rel)
+            except OSError:
+                continue
+            digest.update(f"\0{rel}\0{file_hash}".encode())
+        return digest.hexdigest()
+
+    def restore(self, key: str, workspace: Path, outputs: tuple[str, ...] = ()) -> dict | None:
+        """
+        Put a cached run's outputs into workspace and return its result, or None.
+        Every declared output is removed first, as before a real run, so a file
+        the cached run did not produce can't be left behind to be validated.
+        """
+        entry = self.root / key
+        try:
+            meta = json.loads((entry / "meta.json").read_text())
+            for name in outputs:
+                (workspace / name).unlink(missing_ok=True)
+            for name in meta["outputs"]:
+                shutil.copyfile(entry / "files" / name, workspace / name)
+            os.utime(entry)
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None  # Missing, corrupt or evicted mid-read
+        return meta["result"]
+
+    def put(self, key: str, workspace: Path, outputs: tuple[str, ...], result: dict) -> None:
+        """Store a run's result and whichever of its outputs exist, then evict."""
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        try:
+            (tmp / "files").mkdir(parents=True, exist_ok=True)
+            produced = []
+            for name in outputs:
+                if (workspace / name).is_file():
+                    (tmp / "files" / name).parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(workspace / name, tmp / "files" / name)
+                    produced.append(name)
+            meta = {"result": result, "outputs": produced, "created": time.time()}
+            (tmp / "meta.json").write_text(json.dumps(meta))
+            os.rename(tmp, self.root / key)
+        except OSError:
+            # Another process stored the same run first, or the cache is read-only
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        evict_lru(self.root, self.max_bytes)
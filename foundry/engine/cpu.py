@@ -0,0 +1,133 @@
+"""CPU budget detection and per-job thread allocation."""
+
+import functools
+import math
+import os
+import sys
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Environment variables read by the BLAS / OpenMP runtimes numpy and torch link against
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _cgroup_paths() -> dict[str, str]:
+    """Map each controller in /proc/self/cgroup to this process's cgroup path ("" for v2)."""
+    paths = {}
+    for line in (_read(Path("/proc/self/cgroup")) or "").splitlines():
+        _, controllers, path = line.split(":", 2)
+        for controller in controllers.split(",") if controllers else [""]:
+            paths[controller] = path
+    return paths
+
+
+def _ancestors(base: Path, path: str) -> list[Path]:
+    """The cgroup directory for path under base and every parent up to base."""
+    dirs = []
+    current = base / path.lstrip("/")
+    while True:
+        dirs.append(current)
+        if current == base:
+            return dirs
+        current = current.parent
+
+
+def _quota_v2(path: str) -> float | None:
+    """Tightest cpu.max limit ("<quota> <period>" or "max <period>") on the way to the root."""
+    limits = []
+    for directory in _ancestors(CGROUP_ROOT, path):
+        fields = (_read(directory / "cpu.max") or "").split()
+        if len(fields) == 2 and fields[0] != "max":
+            limits.append(int(fields[0]) / int(fields[1]))
+    return min(limits) if limits else None
+
+
+def _quota_v1(path: str) -> float | None:
+    """CFS quota and period from the v1 cpu controller (-1 quota means unlimited)."""
+    for mount in ("cpu", "cpu,cpuacct", "cpuacct,cpu"):
+        base = CGROUP_ROOT / mount
+        if not base.is_dir():
+            continue
+        # Inside a container the cgroup is usually mounted as its own root
+        for directory in (base / path.lstrip("/"), base):
+            quota = _read(directory / "cpu.cfs_quota_us")
+            period = _read(directory / "cpu.cfs_period_us")
+            if quota and period and int(quota) > 0 and int(period) > 0:
+                return int(quota) / int(period)
+    return None
+
+
+def cgroup_cpu_quota() -> float | None:
+    """CPUs' worth of time this process's cgroup may use, or None if unlimited."""
+    try:
+        paths = _cgroup_paths()
+        if "" in paths:
+            quota = _quota_v2(paths[""])
+            if quota is not None:
+                return quota
+        if "cpu" in paths:
+            return _quota_v1(paths["cpu"])
+    except ValueError:
+        pass  # Unexpected file format; treat as unlimited
+    return None
+
+
+@functools.cache
+def available_cpus() -> int:
+    """
+    CPUs this process can actually use: the smaller of its affinity mask and
+    its cgroup quota (rounded up). FOUNDRY_CPUS overrides detection.
+    """
+    try:
+        return max(1, int(os.environ["FOUNDRY_CPUS"]))
+    except (KeyError, ValueError):
+        pass
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def threads_per_job(jobs: int) -> int:
+    """Split the available CPUs evenly across jobs running at the same time."""
+    return max(1, available_cpus() // max(1, jobs))
+
+
+def thread_env(threads: int) -> dict[str, str]:
+    """Environment capping every known thread pool at threads."""
+    return {name: str(threads) for name in THREAD_ENV_VARS}
+
+
+def limit_threads(threads: int) -> None:
+    """
+    Cap thread pools of libraries that are already imported (so their
+    environment variables were read too early to matter), as in the zygote.
+    """
+    os.environ.update(thread_env(threads))
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        pass
+    else:
+        threadpool_limits(threads)
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
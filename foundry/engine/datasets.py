@@ -0,0 +1,402 @@
+"""Shared store of generated mission datasets."""
+
+import contextlib
+import errno
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import IO, Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+from foundry.engine.cache import evict_lru
+from foundry.engine.cpu import available_cpus
+from foundry.engine.state import SAVE_DIR
+
+DATASET_DIR = SAVE_DIR / "datasets"
+
+# Total size of stored datasets before the least recently used are evicted
+DATASET_CACHE_MB = int(os.environ.get("FOUNDRY_DATASET_CACHE_MB", 1024))
+
+# Array rows serialised per write by write_json
+JSON_CHUNK_ROWS = 4096
+
+# Rows generated per step by write_npy. Each chunk has its own random stream,
+# so this is part of a dataset's definition: changing it changes the data.
+NPY_CHUNK_ROWS = 65536
+
+# Suffixes of an array write_npy is still generating and of its chunk checksums
+PARTIAL_SUFFIX = ".partial"
+MANIFEST_SUFFIX = ".manifest"
+
+# ioctl(2) request that clones a file's extents (Btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone src to dst; False if the filesystem can't."""
+    if fcntl is None:
+        return False
+    with src.open("rb") as fsrc:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(fd, FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            os.unlink(dst)
+            return False
+        finally:
+            os.close(fd)
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """
+    Place src at dst as cheaply as the filesystem allows: a reflink, else a
+    hardlink to the read-only stored file, else a plain copy. Returns the
+    method used.
+    """
+    dst.unlink(missing_ok=True)
+    if _reflink(src, dst):
+        return "reflink"
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError as exc:
+        if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+def write_json(path: Path, fields: dict, chunk_rows: int = JSON_CHUNK_ROWS) -> None:
+    """
+    Write fields as a JSON object, streaming numpy array values to the file
+    chunk_rows rows at a time, so memory stays proportional to a chunk
+    rather than to the dataset. 2-D arrays get one row per line.
+    """
+    with path.open("w") as f:
+        f.write("{")
+        for i, (key, value) in enumerate(fields.items()):
+            f.write(f"{',' if i else ''}\n  {json.dumps(key)}: ")
+            if hasattr(value, "ndim") and value.ndim >= 1:
+                _write_json_array(f, value, chunk_rows)
+            else:
+                f.write(json.dumps(value.tolist() if hasattr(value, "tolist") else value))
+        f.write("\n}\n")
+
+
+def _write_json_array(f: IO[str], array, chunk_rows: int) -> None:
+    if not len(array):
+        f.write("[]")
+        return
+    f.write("[")
+    for start in range(0, len(array), chunk_rows):
+        # One encoder call per chunk; then break 2-D chunks into a row per line
+        text = json.dumps(array[start:start + chunk_rows].tolist())[1:-1]
+        if array.ndim == 2:
+            text = text.replace("], [", "],\n    [")
+        f.write(f"{',' if start else ''}\n    {text}")
+    f.write("\n  ]")
+
+
+# Set by generation_progress
+_progress: Callable[[str, int, int], None] | None = None
+
+
+@contextlib.contextmanager
+def generation_progress(callback: Callable[[str, int, int], None]) -> Iterator[None]:
+    """While active, write_npy reports callback(file name, rows done, total rows)."""
+    global _progress
+    previous, _progress = _progress, callback
+    try:
+        yield
+    finally:
+        _progress = previous
+
+
+def write_npy(
+    path: Path,
+    shape: tuple[int, ...],
+    dtype,
+    fill: Callable[[int, int, object], object],
+    seed,
+    chunk_rows: int = NPY_CHUNK_ROWS,
+    workers: int | None = None,
+) -> None:
+    """
+    Create a .npy file of the given shape and fill it through a memory map,
+    one chunk at a time: fill(start, stop, rng) returns rows [start, stop).
+
+    Each chunk draws from its own numpy Generator, seeded from child i of
+    SeedSequence(seed).spawn() (seed may also be a SeedSequence), so a
+    chunk's rows depend only on seed and its index. Chunks are therefore
+    filled in parallel across workers (default: every usable CPU) into the
+    shared map, and the file is bit-identical whatever the worker count.
+    Peak memory is one chunk per worker, however large the array.
+
+    Rows are written to <name>.partial, and each finished chunk's sha256 is
+    appended to <name>.manifest. An interrupted run therefore resumes:
+    chunks whose checksums still verify are kept and only the rest are
+    generated. The file appears under its real name only once complete,
+    by atomic rename, so readers never see a half-written array.
+    """
+    import numpy as np
+
+    bounds = [(start, min(start + chunk_rows, shape[0])) for start in range(0, shape[0], chunk_rows)]
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    header = {
+        "shape": list(shape),
+        "dtype": np.dtype(dtype).str,
+        "chunk_rows": chunk_rows,
+        "entropy": seed.entropy,
+        "spawn_key": list(seed.spawn_key),
+    }
+    seeds = seed.spawn(len(bounds))
+
+    partial = path.with_name(path.name + PARTIAL_SUFFIX)
+    manifest = path.with_name(path.name + MANIFEST_SUFFIX)
+    if manifest.exists() and path.exists() and not partial.exists() and path.stat().st_nlink == 1:
+        os.replace(path, partial)  # Verify a finished file of ours rather than regenerate it
+    done = _verified_chunks(partial, manifest, header, bounds)
+    if done is None:
+        done = {}
+        partial.unlink(missing_ok=True)  # Never write through a link into another copy
+        out = np.lib.format.open_memmap(partial, mode="w+", dtype=dtype, shape=shape)
+    else:
+        out = np.lib.format.open_memmap(partial, mode="r+")
+    # Rewrite the manifest with just the header and the chunks that verified
+    with manifest.open("w") as log:
+        log.write(json.dumps(header) + "\n")
+        log.writelines(json.dumps({"chunk": i, "sha256": d}) + "\n" for i, d in sorted(done.items()))
+
+    todo = [i for i in range(len(bounds)) if i not in done]
+    rows = sum(stop - start for i, (start, stop) in enumerate(bounds) if i in done)
+    workers = min(workers or available_cpus(), len(todo))
+    pool = None
+    try:
+        with manifest.open("a") as log:
+            def record(i: int, digest: str) -> None:
+                nonlocal rows
+                log.write(json.dumps({"chunk": i, "sha256": digest}) + "\n")
+                log.flush()
+                rows += bounds[i][1] - bounds[i][0]
+                if _progress and len(bounds) > 1:
+                    _progress(path.name, rows, shape[0])
+
+            if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                from concurrent.futures import ProcessPoolExecutor, as_completed
+
+                # Forked workers inherit the map (MAP_SHARED, so their writes land
+                # in the file) and fill itself, which need not be picklable
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_chunk_worker,
+                    initargs=(out, fill),
+                )
+                futures = {pool.submit(_fill_chunk_in_worker, *bounds[i], seeds[i]): i for i in todo}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+            else:
+                for i in todo:
+                    record(i, _fill_chunk(out, fill, *bounds[i], seeds[i]))
+        out.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)  # Don't generate the rest after an interrupt
+        del out
+    os.replace(partial, path)
+
+
+def _verified_chunks(
+    partial: Path,
+    manifest: Path,
+    header: dict,
+    bounds: list[tuple[int, int]],
+) -> dict[int, str] | None:
+    """
+    Checksums of the chunks of an interrupted write_npy that are still
+    intact, or None if there is nothing to resume (no partial file, or one
+    written for a different shape, dtype, chunking or seed).
+    """
+    import numpy as np
+
+    try:
+        with manifest.open() as log:
+            if json.loads(log.readline()) != header:
+                return None
+            recorded = {}
+            for line in log:
+                try:
+                    entry = json.loads(line)
+                    recorded[entry["chunk"]] = entry["sha256"]
+                except (ValueError, KeyError, TypeError):
+                    break  # Torn final line
+        out = np.load(partial, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    try:
+        if list(out.shape) != header["shape"] or out.dtype.str != header["dtype"]:
+            return None
+        return {
+            i: digest for i, digest in recorded.items()
+            if 0 <= i < len(bounds) and _checksum(out[slice(*bounds[i])]) == digest
+        }
+    finally:
+        del out
+
+
+def _checksum(rows) -> str:
+    return hashlib.sha256(rows).hexdigest()
+
+
+# The memory map and fill callback of a write_npy worker process
+_chunk_worker: tuple | None = None
+
+
+def _init_chunk_worker(out, fill: Callable) -> None:
+    global _chunk_worker
+    _chunk_worker = (out, fill)
+
+
+def _fill_chunk_in_worker(start: int, stop: int, seed) -> str:
+    return _fill_chunk(*_chunk_worker, start, stop, seed)
+
+
+def _fill_chunk(out, fill: Callable, start: int, stop: int, seed) -> str:
+    """Generate rows [start, stop) into out and return their checksum."""
+    import numpy as np
+
+    out[start:stop] = fill(start, stop, np.random.default_rng(seed))
+    return _checksum(out[start:stop])
+
+
+def build_in_place(build: Callable[[Path], None], directory: Path) -> None:
+    """Run a dataset build straight into directory, leaving only the data files."""
+    # Files still hardlinked to a stored dataset must not be rewritten through
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            if os.stat(path).st_nlink > 1:
+                os.unlink(path)
+    build(directory)
+    for manifest in directory.rglob(f"*{MANIFEST_SUFFIX}"):
+        manifest.unlink()
+
+
+def dataset_key(mission_id: str, version: int, params: dict) -> str:
+    """Short content key of the dataset a generator produces for these inputs."""
+    key = json.dumps([mission_id, version, params], sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+class DatasetStore:
+    """
+    Generated datasets, keyed by mission id, generator version and parameters.
+
+    A dataset is built once into a temporary directory and renamed into
+    place, so readers never see a partial one. Builders of the same dataset
+    take turns under a lock, and an interrupted build's directory is left
+    for the next one to resume (write_npy keeps the chunks that verify).
+    Stored files are made
+    read-only because workspaces may hardlink to them. Datasets are
+    evicted least recently used first once the store exceeds max_bytes;
+    evicting one never affects workspaces already linked to it.
+    """
+
+    def __init__(self, root: Path = DATASET_DIR, max_bytes: int = DATASET_CACHE_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path(self, mission_id: str, version: int, params: dict) -> Path:
+        """Where the dataset for these inputs lives in the store."""
+        return self.root / f"{mission_id}-{dataset_key(mission_id, version, params)}"
+
+    def get(
+        self,
+        mission_id: str,
+        version: int,
+        params: dict,
+        build: Callable[[Path], None],
+    ) -> Path:
+        """Return the stored dataset directory, building it with build(dir) if missing."""
+        entry = self.path(mission_id, version, params)
+        if entry.is_dir():
+            os.utime(entry)
+            return entry
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        lock = self.root / f".{entry.name}.lock"
+        with _locked(lock) as exclusive:
+            if entry.is_dir():
+                return entry  # Another process built it while we waited
+            # Kept if the build is interrupted, so the next one resumes it
+            tmp = self.root / (f".{entry.name}.tmp" if exclusive else f".{entry.name}.{os.getpid()}.tmp")
+            tmp.mkdir(exist_ok=True)
+            try:
+                build_in_place(build, tmp)
+            except BaseException:
+                if not exclusive:
+                    shutil.rmtree(tmp, ignore_errors=True)  # Nobody else can resume it
+                raise
+            for root, _, names in os.walk(tmp):
+                for name in names:
+                    os.chmod(os.path.join(root, name), _READ_ONLY)
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                if not entry.is_dir():
+                    raise
+                shutil.rmtree(tmp, ignore_errors=True)  # Lost the race to publish
+            # Safe: later builders see the entry before they ever take the lock
+            lock.unlink(missing_ok=True)
+        return entry
+
+    def install(
+        self,
+        mission_id: str,
+        version: int,
+        params: dict,
+        build: Callable[[Path], None],
+        dest: Path,
+    ) -> None:
+        """Materialise a dataset's files into dest, building it first if needed."""
+        entry = self.get(mission_id, version, params, build)
+        try:
+            for root, _, names in os.walk(entry, onerror=_raise):
+                target = dest / os.path.relpath(root, entry)
+                target.mkdir(parents=True, exist_ok=True)
+                for name in names:
+                    link_or_copy(Path(root) / name, target / name)
+        except FileNotFoundError:
+            build_in_place(build, dest)  # Evicted by another process mid-install
+        # Only now, so a dataset larger than the whole budget still gets installed
+        evict_lru(self.root, self.max_bytes)
+
+
+@contextlib.contextmanager
+def _locked(path: Path) -> Iterator[bool]:
+    """Hold an exclusive lock on path; yields False where locking is unavailable."""
+    if fcntl is None:
+        yield False
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield True
+    finally:
+        os.close(fd)
+
+
+def _raise(exc: OSError) -> None:
+    raise exc
@@ -0,0 +1,84 @@
+"""Validation executor - runs independent checkpoint validators concurrently."""
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from foundry.engine.base import Mission, Checkpoint
+from foundry.engine.cache import VerdictCache
+from foundry.engine.cpu import available_cpus
+
+
+def _default_workers() -> int:
+    """Worker count from FOUNDRY_WORKERS, falling back to the usable CPU count."""
+    try:
+        return max(1, int(os.environ.get("FOUNDRY_WORKERS", "")))
+    except ValueError:
+        return min(8, available_cpus())
+
+
+# Number of checkpoints validated at the same time (FOUNDRY_WORKERS overrides)
+DEFAULT_WORKERS = _default_workers()
+
+# "thread" suits file-reading validators; "process" suits CPU-heavy ones
+DEFAULT_POOL = os.environ.get("FOUNDRY_POOL", "thread")
+
+
+def _validate(mission: Mission, checkpoint_id: str) -> tuple[bool, str]:
+    """Run a single validator (module level so process pools can pickle it)."""
+    return mission.validate_checkpoint(checkpoint_id)
+
+
+def validate_checkpoints(
+    mission: Mission,
+    checkpoints: list[Checkpoint] | None = None,
+    workers: int | None = None,
+    pool: str | None = None,
+    use_cache: bool = True,
+) -> list[tuple[bool, str]]:
+    """
+    Validate checkpoints concurrently.
+    Returns (success, message) pairs in checkpoint order.
+
+    Verdicts for checkpoints whose workspace files are unchanged since the
+    last pass are served from the verdict cache without re-running them.
+    """
+    if checkpoints is None:
+        checkpoints = mission.get_checkpoints()
+
+    results: list[tuple[bool, str] | None] = [None] * len(checkpoints)
+    cache = VerdictCache(mission, mission.workspace) if use_cache and mission.workspace else None
+    keys: list[str] = []
+    if cache:
+        keys = [cache.key(cp) for cp in checkpoints]
+        for i, cp in enumerate(checkpoints):
+            results[i] = cache.get(cp, keys[i])
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    for i, verdict in zip(pending, _run(mission, [checkpoints[i].id for i in pending], workers, pool)):
+        results[i] = verdict
+        if cache:
+            cache.put(checkpoints[i], keys[i], verdict)
+
+    if cache:
+        cache.save()
+    return results
+
+
+def _run(
+    mission: Mission,
+    ids: list[str],
+    workers: int | None,
+    pool: str | None,
+) -> list[tuple[bool, str]]:
+    """Run validators on a pool, preserving order."""
+    workers = min(workers or DEFAULT_WORKERS, len(ids))
+    if workers <= 1:
+        return [_validate(mission, checkpoint_id) for checkpoint_id in ids]
+
+    executor_class: type[Executor] = ThreadPoolExecutor
+    if (pool or DEFAULT_POOL) == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor_class = ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        return list(executor.map(_validate, [mission] * len(ids), ids))
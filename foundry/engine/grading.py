@@ -0,0 +1,169 @@
+"""Batch grading - validate many learner workspaces in a process pool."""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import IO, Iterator
+
+from foundry.engine.base import get_all_mission_info, get_mission
+from foundry.engine.cpu import available_cpus, threads_per_job
+from foundry.engine.executor import validate_checkpoints
+from foundry.engine.sandbox import run_mission_script
+from foundry.engine.variants import apply_variant, learner_seed, variant_problem
+from foundry.engine.workspace import WorkspaceSnapshot
+
+# Workspaces handed to a worker at a time; amortises process round trips
+BATCH_SIZE = 16
+
+CSV_FIELDS = [
+    "student", "mission_id", "workspace", "passed", "total",
+    "complete", "xp", "failed", "variant", "run", "error", "seconds",
+]
+
+
+def find_workspaces(root: Path) -> Iterator[tuple[str, str, Path]]:
+    """
+    Yield (student, mission_id, workspace) for every mission workspace under root.
+    A workspace is a directory named after a mission; the student is its
+    parent directory relative to root.
+    """
+    mission_ids = set(get_all_mission_info())
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames.sort()
+        for name in list(dirnames):
+            if name in mission_ids:
+                dirnames.remove(name)  # Don't descend into workspaces
+                student = os.path.relpath(dirpath, root)
+                yield student, name, Path(dirpath) / name
+
+
+def grade_workspace(
+    student: str,
+    mission_id: str,
+    workspace: Path,
+    use_cache: bool = True,
+    run: bool = False,
+    threads: int | None = None,
+    cohort_seed: int | None = None,
+) -> dict:
+    """
+    Run a mission's validators against one workspace and return a result row.
+    With run, the learner's script is executed in the sandbox first, its
+    thread pools capped at threads; a failed run makes the row incomplete.
+    Validators see the dataset variant the workspace was set up with; given
+    cohort_seed, a workspace not holding the student's own variant is never
+    complete.
+    """
+    start = time.perf_counter()
+    row = {"student": student, "mission_id": mission_id, "workspace": str(workspace),
+           "variant": None, "run": None}
+    try:
+        mission = get_mission(mission_id)()
+        marker = apply_variant(mission, workspace)
+        row["variant"] = marker.get("variant") if marker else None
+        expected = learner_seed(cohort_seed, student) if cohort_seed is not None else None
+        problem = variant_problem(mission, marker, expected)
+        if run:
+            result = run_mission_script(mission, workspace, use_cache, threads)
+            row["run"] = result.to_dict() if result else None
+            if result and not result.ok and problem is None:
+                problem = f"Script failed: {result.summary()}"
+        mission.workspace = workspace
+        mission.snapshot = WorkspaceSnapshot(workspace)
+        checkpoints = mission.get_checkpoints()
+        results = validate_checkpoints(mission, checkpoints, workers=1, use_cache=use_cache)
+    except Exception as exc:
+        row.update(passed=0, total=0, complete=False, xp=0, checkpoints={},
+                   error=f"{type(exc).__name__}: {exc}")
+    else:
+        passed = sum(success for success, _ in results)
+        complete = passed == len(checkpoints) and problem is None
+        row.update(
+            passed=passed,
+            total=len(checkpoints),
+            complete=complete,
+            xp=mission.info.xp_reward if complete else 0,
+            checkpoints={
+                cp.id: {"passed": success, "message": message}
+                for cp, (success, message) in zip(checkpoints, results)
+            },
+            error=problem,
+        )
+    row["seconds"] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def _grade_batch(
+    batch: list[tuple[str, str, Path]],
+    use_cache: bool,
+    run: bool,
+    threads: int,
+    cohort_seed: int | None,
+) -> list[dict]:
+    return [
+        grade_workspace(*job, use_cache=use_cache, run=run, threads=threads, cohort_seed=cohort_seed)
+        for job in batch
+    ]
+
+
+def grade_all(
+    root: Path,
+    workers: int | None = None,
+    use_cache: bool = True,
+    run: bool = False,
+    cohort_seed: int | None = None,
+) -> Iterator[dict]:
+    """Grade every workspace under root, yielding rows as they finish."""
+    jobs = list(find_workspaces(root))
+    batches = [jobs[i:i + BATCH_SIZE] for i in range(0, len(jobs), BATCH_SIZE)]
+    workers = min(workers or available_cpus(), max(len(batches), 1))
+    # Each worker runs one script at a time, so they share the CPUs evenly
+    threads = threads_per_job(workers)
+
+    if workers <= 1:
+        for batch in batches:
+            yield from _grade_batch(batch, use_cache, run, threads, cohort_seed)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_grade_batch, batch, use_cache, run, threads, cohort_seed)
+            for batch in batches
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _run_summary(run: dict) -> str:
+    status = "ok" if run["returncode"] == 0 and not run["timed_out"] else "failed"
+    return f"{status} ({run['seconds']}s, {run['threads']} threads{', cached' if run['cached'] else ''})"
+
+
+class RowWriter:
+    """Streams grading rows as JSONL or CSV, flushing after each row."""
+
+    def __init__(self, stream: IO[str], fmt: str = "jsonl"):
+        self.stream = stream
+        self.fmt = fmt
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, row: dict) -> None:
+        if self._csv:
+            failed = [cp for cp, verdict in row["checkpoints"].items() if not verdict["passed"]]
+            run = row.get("run")
+            self._csv.writerow({
+                **row,
+                "failed": ";".join(failed),
+                "variant": row["variant"] or "",
+                "run": _run_summary(run) if run else "",
+                "error": row["error"] or "",
+            })
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+        self.stream.flush()
@@ -0,0 +1,137 @@
+"""Append-only event journal with snapshot compaction for player state."""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+from foundry.engine.storage import StateBackend
+
+
+class Journal(StateBackend):
+    """
+    Single-player backend: a JSONL event log plus a JSON snapshot.
+
+    Events are appended and fsynced one batch at a time, so a write costs
+    O(1) regardless of history. Periodically the full state is written to
+    the snapshot (atomically, via rename) and the log is truncated. Every
+    event carries a sequence number; replay skips events already folded
+    into the snapshot and ignores a torn final line left by a crash.
+    Concurrent processes coordinate through an advisory lock file.
+    """
+
+    def __init__(self, path: Path, snapshot_path: Path, compact_every: int = 100):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self.lock_path = path.with_suffix(".lock")
+        self.pending = 0  # Events appended since the last snapshot
+
+    @contextmanager
+    def lock(self, shared: bool = False) -> Iterator[None]:
+        """Advisory flock(2) on a sidecar lock file."""
+        if fcntl is None:
+            yield
+            return
+        try:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            # Read-only save directory: nothing can be written, so nothing to guard
+            yield
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # Closing releases the lock
+
+    def load(self) -> tuple[dict | None, list[dict]]:
+        snapshot = self.read_snapshot()
+        after = snapshot.get("journal_seq", 0) if isinstance(snapshot, dict) else 0
+        return snapshot, self.read_events(after)
+
+    def record(self, state: dict, events: list[dict]) -> None:
+        self.append(events)
+        if self.pending >= self.compact_every:
+            self.save(state)
+
+    def save(self, state: dict) -> None:
+        self.write_snapshot(state)
+
+    def read_snapshot(self) -> dict | None:
+        """Return the latest snapshot, or None if there is none (or it is truncated)."""
+        if not self.snapshot_path.exists():
+            return None
+        try:
+            return json.loads(self.snapshot_path.read_text())
+        except json.JSONDecodeError:
+            return None  # Events newer than the last good snapshot still replay
+
+    def read_events(self, after_seq: int = 0) -> list[dict]:
+        """Return logged events newer than after_seq, in order."""
+        events = []
+        if self.path.exists():
+            with self.path.open("rb") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write from an interrupted append
+                    if isinstance(event, dict) and event.get("seq", 0) > after_seq:
+                        events.append(event)
+        self.pending = len(events)
+        return events
+
+    def append(self, events: list[dict]) -> None:
+        """Durably append a batch of events. Call with the lock held."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b"\n":
+                # Start past a torn final line rather than glue the batch onto it
+                data = "\n" + data
+            os.write(fd, data.encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self.pending += len(events)
+
+    def write_snapshot(self, data: dict) -> None:
+        """Atomically replace the snapshot, then drop the events it covers."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("w") as f:
+            f.write(json.dumps(data, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        _fsync_dir(self.snapshot_path.parent)
+
+        # A crash before this point is harmless: replay skips covered events
+        if self.path.exists():
+            with self.path.open("w"):
+                pass
+        self.pending = 0
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename by syncing its directory (not supported everywhere)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,143 @@
+"""Prebuilt track and mission manifest.
+
+Listing missions used to import every mission module (and numpy with it).
+The manifest records track metadata and each mission's MissionInfo plus the
+module that defines it, so listings read JSON and a mission module is only
+imported when its class is actually needed.
+
+Besides the built-in tracks under foundry/tracks, third-party tracks are
+discovered through the "foundry.tracks" entry point group. The manifest is
+built on first run and rebuilt whenever the built-in track sources or the
+set of installed distributions change.
+"""
+
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from foundry import __version__
+from foundry.engine.state import SAVE_DIR
+from foundry.engine.tiers import Tier
+
+MANIFEST_PATH = SAVE_DIR / "cache" / "manifest.json"
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = 2
+
+# Entry point group third-party tracks register under
+ENTRY_POINT_GROUP = "foundry.tracks"
+
+_TRACKS_DIR = Path(__file__).resolve().parent.parent / "tracks"
+
+_manifest: dict | None = None
+
+
+def _source_stamp() -> str:
+    """
+    Identify the installed tracks without importing anything.
+
+    Built-in track sources are stamped file by file. Installing or removing
+    a distribution adds or deletes its metadata directory in site-packages,
+    which bumps that directory's mtime, so stamping the site-packages
+    directories covers entry point plugins without reading their metadata.
+    """
+    latest = 0
+    count = 0
+    for root, _, names in os.walk(_TRACKS_DIR):
+        for name in names:
+            if name.endswith(".py"):
+                latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+                count += 1
+
+    paths = []
+    for entry in sys.path:
+        if os.path.basename(entry) not in ("site-packages", "dist-packages"):
+            continue
+        try:
+            paths.append(f"{entry}={os.stat(entry).st_mtime_ns}")
+        except OSError:
+            continue
+    return f"{__version__}:{count}:{latest}:{';'.join(paths)}"
+
+
+def _load_plugins() -> None:
+    """Import third-party tracks registered under the foundry.tracks entry point group."""
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            entry_point.load()
+        except Exception as exc:
+            from foundry.ui.console import console
+
+            console.print(f"[yellow]Skipping track plugin {entry_point.name}: {exc}[/yellow]")
+
+
+def info_to_dict(info) -> dict:
+    """Serialise a MissionInfo (checkpoints hold callables and are left out)."""
+    data = asdict(info)
+    data.pop("checkpoints", None)
+    data["tier"] = info.tier.value
+    return data
+
+
+def info_from_dict(data: dict):
+    """Rebuild a MissionInfo from its manifest entry."""
+    from foundry.engine.base import MissionInfo
+
+    return MissionInfo(**{**data, "tier": Tier(data["tier"])})
+
+
+def build_manifest(stamp: str) -> dict:
+    """Import every track and record what it registered."""
+    import foundry.tracks  # noqa: F401 - registers built-in tracks and missions
+    from foundry.engine.base import _missions, _tracks
+
+    _load_plugins()
+
+    return {
+        "format": MANIFEST_FORMAT,
+        "stamp": stamp,
+        "tracks": dict(_tracks),
+        "missions": {
+            mission_id: {
+                "module": mission_class.__module__,
+                "info": info_to_dict(mission_class.info),
+            }
+            for mission_id, mission_class in _missions.items()
+        },
+    }
+
+
+def _write(manifest: dict) -> None:
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MANIFEST_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, MANIFEST_PATH)
+    except OSError:
+        pass
+
+
+def load_manifest() -> dict:
+    """Return the manifest, rebuilding it if it is missing or stale."""
+    global _manifest
+    if _manifest is not None:
+        return _manifest
+
+    stamp = _source_stamp()
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text())
+        if manifest.get("format") != MANIFEST_FORMAT or manifest.get("stamp") != stamp:
+            manifest = None
+    except (OSError, json.JSONDecodeError):
+        manifest = None
+
+    if manifest is None:
+        manifest = build_manifest(stamp)
+        _write(manifest)
+
+    _manifest = manifest
+    return _manifest
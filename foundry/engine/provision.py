@@ -0,0 +1,78 @@
+"""Bulk provisioning - set up one mission for a whole cohort of learners."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+
+from foundry.engine.base import get_mission
+from foundry.engine.cpu import available_cpus, limit_threads, threads_per_job
+from foundry.engine.variants import learner_seed, write_variant
+
+
+def provision_workspace(
+    player: str,
+    mission_id: str,
+    root: Path,
+    cohort_seed: int,
+    params: dict[str, str],
+) -> dict:
+    """
+    Set up root/player/mission_id with the player's own dataset variant.
+    Returns a result row; errors are reported in it rather than raised.
+    """
+    start = time.perf_counter()
+    workspace = root / player / mission_id
+    seed = learner_seed(cohort_seed, player)
+    row = {"player": player, "workspace": str(workspace), "seed": seed, "variant": None, "error": None}
+    try:
+        mission = get_mission(mission_id)()
+        # Nobody else will reuse this variant; keep it out of the shared store
+        mission.share_dataset = False
+        mission.set_params({**params, "seed": str(seed)})
+        mission.setup(workspace)
+        row["variant"] = write_variant(workspace, mission, player)["variant"]
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["seconds"] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def _share_cpus(cpus: int) -> None:
+    """Pool initializer: give each worker its share of the CPUs for dataset generation."""
+    os.environ["FOUNDRY_CPUS"] = str(cpus)
+    available_cpus.cache_clear()
+    limit_threads(cpus)
+
+
+def provision_all(
+    mission_id: str,
+    players: list[str],
+    root: Path,
+    cohort_seed: int,
+    params: dict[str, str] | None = None,
+    workers: int | None = None,
+) -> Iterator[dict]:
+    """
+    Provision a workspace per player, several at a time, yielding rows as
+    they finish. Learners are spread across the workers and each worker's
+    dataset generation uses only its share of the CPUs.
+    """
+    params = params or {}
+    workers = min(workers or available_cpus(), max(len(players), 1))
+
+    if workers <= 1:
+        for player in players:
+            yield provision_workspace(player, mission_id, root, cohort_seed, params)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_share_cpus, initargs=(threads_per_job(workers),)
+    ) as executor:
+        futures = [
+            executor.submit(provision_workspace, player, mission_id, root, cohort_seed, params)
+            for player in players
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -1,23 +1,29 @@
 """Mission runner - handles mission execution and validation."""
 
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.markdown import Markdown
+from typing import TYPE_CHECKING, Iterator
 
 from foundry.engine.state import GameState, SAVE_DIR
 from foundry.engine.base import (
     get_mission,
-    get_all_missions,
+    get_all_mission_info,
     get_missions_for_tier,
-    get_missions_for_track,
+    get_mission_info_for_track,
     get_all_tracks,
     Mission,
+    Checkpoint,
     CheckpointStatus,
 )
+from foundry.engine.executor import validate_checkpoints
+from foundry.engine.workspace import WorkspaceSnapshot
+from foundry.ui.console import console, get_console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
 
 # Default workspace location
 WORKSPACE_BASE = SAVE_DIR / "workspace"
@@ -28,8 +34,13 @@ def get_workspace(mission_id: str) -> Path:
     return WORKSPACE_BASE / mission_id
 
 
-def start_mission(state: GameState, mission_id: str) -> bool:
-    """Start a mission, setting up its workspace."""
+def start_mission(state: GameState, mission_id: str, params: dict[str, str] | None = None) -> bool:
+    """Start a mission, setting up its workspace (params override dataset defaults)."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from foundry.engine.variants import write_variant
+
     mission_class = get_mission(mission_id)
     if not mission_class:
         console.print(f"[red]Mission not found: {mission_id}[/red]")
@@ -37,10 +48,17 @@ def start_mission(state: GameState, mission_id: str) -> bool:
 
     mission = mission_class()
     workspace = get_workspace(mission_id)
-
     # Setup workspace
     console.print(f"[cyan]Setting up mission workspace...[/cyan]")
-    mission.setup(workspace)
+    try:
+        mission.set_params(params or {})
+        with _dataset_progress():
+            mission.setup(workspace)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        return False
+    write_variant(workspace, mission)
+    state.start_mission(mission_id)
 
     # Show mission briefing
     console.print()
@@ -61,8 +79,47 @@ def start_mission(state: GameState, mission_id: str) -> bool:
     return True
 
 
-def check_mission(state: GameState, mission_id: str) -> None:
+@contextmanager
+def _dataset_progress() -> Iterator[None]:
+    """Show a progress bar per array while large datasets are generated."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn
+
+    from foundry.engine.datasets import generation_progress
+
+    progress = Progress(
+        TextColumn("[cyan]Generating {task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=get_console(),
+        transient=True,
+    )
+    tasks = {}
+
+    def report(name: str, done: int, total: int) -> None:
+        if not tasks:
+            progress.start()  # Only once there is something worth showing
+        if name not in tasks:
+            tasks[name] = progress.add_task(name, total=total)
+        progress.update(tasks[name], completed=done)
+
+    try:
+        with generation_progress(report):
+            yield
+    finally:
+        progress.stop()
+
+
+def check_mission(
+    state: GameState,
+    mission_id: str,
+    workers: int | None = None,
+    use_cache: bool = True,
+    run: bool = False,
+) -> None:
     """Check progress on a mission."""
+    from rich.panel import Panel
+
     mission_class = get_mission(mission_id)
     if not mission_class:
         console.print(f"[red]Mission not found: {mission_id}[/red]")
@@ -75,27 +132,23 @@ def check_mission(state: GameState, mission_id: str) -> None:
         console.print(f"[yellow]Mission not started. Run:[/yellow] nf play {mission_id}")
         return
 
+    _load_variant(mission, workspace)
+    if run:
+        _run_learner_script(mission, workspace, use_cache)
+
     mission.workspace = workspace
+    mission.snapshot = WorkspaceSnapshot(workspace)
 
     # Check each checkpoint
-    table = Table(title=f"Mission Progress: {mission.info.title}", border_style="cyan")
-    table.add_column("Status", width=8)
-    table.add_column("Checkpoint")
-    table.add_column("Details")
-
-    all_complete = True
-    for cp in mission.get_checkpoints():
-        success, message = mission.validate_checkpoint(cp.id)
-
+    checkpoints = mission.get_checkpoints()
+    results = validate_checkpoints(mission, checkpoints, workers=workers, use_cache=use_cache)
+    for cp, (success, _) in zip(checkpoints, results):
         if success:
-            status = "[green]✓[/green]"
             cp.status = CheckpointStatus.COMPLETED
-        else:
-            status = "[yellow]○[/yellow]"
-            all_complete = False
-
-        table.add_row(status, cp.title, message)
+    all_complete = all(success for success, _ in results)
+    state.pass_checkpoints(mission_id, [cp.id for cp, (ok, _) in zip(checkpoints, results) if ok])
 
+    table = _progress_table(f"Mission Progress: {mission.info.title}", checkpoints, results)
     console.print(table)
 
     if all_complete:
@@ -114,8 +167,151 @@ def check_mission(state: GameState, mission_id: str) -> None:
             console.print(f"[dim]Hint: {current.hint}[/dim]")
 
 
-def complete_mission(state: GameState, mission_id: str) -> bool:
+def _load_variant(mission: Mission, workspace: Path) -> None:
+    """Give the mission the workspace's dataset variant, warning if it looks stale."""
+    from foundry.engine.variants import apply_variant, variant_problem
+
+    problem = variant_problem(mission, apply_variant(mission, workspace))
+    if problem:
+        console.print(f"[yellow]{problem}[/yellow]")
+
+
+def _run_learner_script(mission: Mission, workspace: Path, use_cache: bool = True) -> bool:
+    """Run the mission's script in the sandbox and report how it went."""
+    from foundry.engine.sandbox import run_mission_script
+
+    if not mission.script:
+        return True
+    with console.status(f"[cyan]Running {mission.script}...[/cyan]"):
+        result = run_mission_script(mission, workspace, use_cache)
+    if result.ok:
+        console.print(f"[green]{result.summary()}[/green]")
+        return True
+    console.print(f"[red]{result.summary()}[/red]")
+    if result.output and result.returncode is not None:
+        tail = "\n".join(result.output.rstrip().splitlines()[-20:])
+        console.print(tail, style="dim", markup=False, highlight=False)
+    return False
+
+
+def _progress_table(
+    title: str,
+    checkpoints: list[Checkpoint],
+    results: list[tuple[bool, str]],
+) -> "Table":
+    """Build the checkpoint progress table."""
+    from rich.table import Table
+
+    table = Table(title=title, border_style="cyan")
+    table.add_column("Status", width=8)
+    table.add_column("Checkpoint")
+    table.add_column("Details")
+
+    for cp, (success, message) in zip(checkpoints, results):
+        status = "[green]✓[/green]" if success else "[yellow]○[/yellow]"
+        table.add_row(status, cp.title, message)
+
+    return table
+
+
+def _watch_verdicts(
+    mission: Mission,
+    checkpoints: list[Checkpoint],
+    workers: int | None,
+    use_cache: bool,
+) -> list[tuple[bool, str]]:
+    """
+    Validate checkpoints for nf watch, where a half-written file must not end
+    the session: a validator that raises fails its own checkpoint instead.
+    """
+    try:
+        return validate_checkpoints(mission, checkpoints, workers=workers, use_cache=use_cache)
+    except Exception:
+        pass
+    # Isolate the culprit so the other checkpoints still get verdicts
+    verdicts = []
+    for cp in checkpoints:
+        try:
+            verdicts += validate_checkpoints(mission, [cp], workers=1, use_cache=use_cache)
+        except Exception as exc:
+            verdicts.append((False, f"Validator error: {type(exc).__name__}: {exc}"))
+    return verdicts
+
+
+def watch_mission(
+    state: GameState,
+    mission_id: str,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> None:
+    """Re-validate a mission's checkpoints whenever its workspace changes."""
+    from rich.live import Live
+
+    from foundry.engine.watch import open_watcher, affected_checkpoints
+
+    mission_class = get_mission(mission_id)
+    if not mission_class:
+        console.print(f"[red]Mission not found: {mission_id}[/red]")
+        return
+
+    mission = mission_class()
+    workspace = get_workspace(mission_id)
+
+    if not workspace.exists():
+        console.print(f"[yellow]Mission not started. Run:[/yellow] nf play {mission_id}")
+        return
+
+    _load_variant(mission, workspace)
+    mission.workspace = workspace
+    mission.snapshot = WorkspaceSnapshot(workspace)
+
+    checkpoints = mission.get_checkpoints()
+    results = _watch_verdicts(mission, checkpoints, workers, use_cache)
+    title = f"Watching: {mission.info.title}"
+
+    def render(caption: str) -> "Table":
+        table = _progress_table(title, checkpoints, results)
+        table.caption = caption
+        return table
+
+    watcher = open_watcher(workspace)
+    console.print(f"[dim]Watching {workspace} - press Ctrl+C to stop[/dim]")
+    with Live(render("Waiting for changes..."), console=get_console(), auto_refresh=False) as live:
+        try:
+            while True:
+                changed = watcher.wait()
+                affected = affected_checkpoints(checkpoints, changed)
+                if not affected:
+                    continue
+                mission.snapshot = WorkspaceSnapshot(workspace)
+                verdicts = _watch_verdicts(mission, affected, workers, use_cache)
+                for cp, verdict in zip(affected, verdicts):
+                    results[checkpoints.index(cp)] = verdict
+
+                passed = sum(success for success, _ in results)
+                caption = (
+                    f"{datetime.now():%H:%M:%S} - {len(affected)} re-checked, "
+                    f"{passed}/{len(checkpoints)} passed"
+                )
+                if passed == len(checkpoints):
+                    caption += f" - run nf complete {mission_id}"
+                live.update(render(caption), refresh=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+
+
+def complete_mission(
+    state: GameState,
+    mission_id: str,
+    workers: int | None = None,
+    use_cache: bool = True,
+    run: bool = False,
+) -> bool:
     """Mark a mission as complete and award XP."""
+    from rich.panel import Panel
+
     mission_class = get_mission(mission_id)
     if not mission_class:
         console.print(f"[red]Mission not found: {mission_id}[/red]")
@@ -128,14 +324,20 @@ def complete_mission(state: GameState, mission_id: str) -> bool:
         console.print(f"[yellow]Mission not started.[/yellow]")
         return False
 
+    _load_variant(mission, workspace)
+
+    if run and not _run_learner_script(mission, workspace, use_cache):
+        console.print(f"[red]Fix {mission.script} before completing the mission.[/red]")
+        return False
+
     mission.workspace = workspace
+    mission.snapshot = WorkspaceSnapshot(workspace)
 
-    # Verify all checkpoints
-    for cp in mission.get_checkpoints():
-        success, _ = mission.validate_checkpoint(cp.id)
-        if not success:
-            console.print(f"[red]Mission not complete. Run 'nf check {mission_id}' to see progress.[/red]")
-            return False
+    # Verify all checkpoints (reuses verdicts from the last check when unchanged)
+    results = validate_checkpoints(mission, workers=workers, use_cache=use_cache)
+    if not all(success for success, _ in results):
+        console.print(f"[red]Mission not complete. Run 'nf check {mission_id}' to see progress.[/red]")
+        return False
 
     # Award completion
     if mission_id in state.missions_completed:
@@ -162,9 +364,122 @@ def complete_mission(state: GameState, mission_id: str) -> bool:
     return True
 
 
+def grade_cohort(
+    root: Path,
+    output: str = "-",
+    fmt: str | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
+    run: bool = False,
+    cohort_seed: int | None = None,
+) -> None:
+    """
+    Grade every mission workspace under root, streaming rows to output.
+    With cohort_seed, each workspace must hold its student's own variant.
+    """
+    from rich.console import Console
+
+    from foundry.engine.grading import grade_all, RowWriter
+
+    fmt = fmt or ("csv" if output.endswith(".csv") else "jsonl")
+    status = Console(stderr=True)
+    start = time.perf_counter()
+    graded = complete = 0
+
+    stream = sys.stdout if output == "-" else open(output, "w", newline="")
+    try:
+        writer = RowWriter(stream, fmt)
+        for row in grade_all(root, workers, use_cache, run, cohort_seed):
+            writer.write(row)
+            graded += 1
+            complete += row["complete"]
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    status.print(
+        f"[green]Graded {graded} workspaces[/green] "
+        f"({complete} complete) in {time.perf_counter() - start:.2f}s"
+    )
+
+
+def provision_cohort(
+    mission_id: str,
+    players: list[str],
+    root: Path,
+    cohort_seed: int,
+    params: dict[str, str] | None = None,
+    workers: int | None = None,
+) -> bool:
+    """Set up a mission workspace with its own dataset variant for every player."""
+    from foundry.engine.provision import provision_all
+
+    mission_class = get_mission(mission_id)
+    if not mission_class:
+        console.print(f"[red]Mission not found: {mission_id}[/red]")
+        return False
+    if "seed" not in mission_class.dataset_params:
+        console.print(f"[red]{mission_id} has no generated dataset to vary per learner[/red]")
+        return False
+    try:
+        mission_class().set_params(params or {})  # Fail fast on bad overrides
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        return False
+    players = list(dict.fromkeys(players))
+    bad = [p for p in players if not p or p in (".", "..") or "/" in p or "\\" in p]
+    if bad or not players:
+        console.print(f"[red]Invalid player names: {', '.join(map(repr, bad)) or 'none given'}[/red]")
+        return False
+
+    start = time.perf_counter()
+    failed = 0
+    with console.status(f"[cyan]Provisioning {len(players)} workspaces...[/cyan]"):
+        for row in provision_all(mission_id, players, root, cohort_seed, params, workers):
+            if row["error"]:
+                failed += 1
+                console.print(f"[red]{row['player']}: {row['error']}[/red]")
+
+    console.print(
+        f"[green]Provisioned {len(players) - failed} workspaces[/green] under {root} "
+        f"in {time.perf_counter() - start:.2f}s"
+        + (f" [red]({failed} failed)[/red]" if failed else "")
+    )
+    console.print(f"[dim]Grade them with: nf grade --root {root} --cohort-seed {cohort_seed}[/dim]")
+    return not failed
+
+
+def serve_grading(
+    host: str,
+    port: int,
+    socket_path: str | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
+    run: bool = False,
+) -> None:
+    """Run the grading service in the foreground until interrupted."""
+    import asyncio
+
+    from foundry.engine.service import GradingService
+
+    if run and not socket_path:
+        console.print("[red]--run executes submitted scripts as you; serve it on a private --socket, "
+                      "not unauthenticated TCP.[/red]")
+        return
+    service = GradingService(workers=workers, use_cache=use_cache, run=run)
+    where = f"unix:{socket_path}" if socket_path else f"http://{host}:{port}"
+    console.print(f"[green]Grading service listening on {where}[/green] ({service.workers} workers)")
+    try:
+        asyncio.run(service.serve(host, port, socket_path))
+    except KeyboardInterrupt:
+        console.print("[dim]Grading service stopped.[/dim]")
+
+
 def list_missions(state: GameState, track: str | None = None) -> None:
     """List available missions, optionally filtered by track."""
-    missions = get_all_missions()
+    from rich.table import Table
+
+    missions = get_all_mission_info()
 
     if not missions:
         console.print("[yellow]No missions available yet.[/yellow]")
@@ -172,7 +487,7 @@ def list_missions(state: GameState, track: str | None = None) -> None:
 
     # Filter by track if specified
     if track:
-        missions = {k: v for k, v in missions.items() if v.info.track == track}
+        missions = {k: v for k, v in missions.items() if v.track == track}
 
     table = Table(title="Available Missions", border_style="cyan")
     table.add_column("ID", style="cyan")
@@ -182,9 +497,7 @@ def list_missions(state: GameState, track: str | None = None) -> None:
     table.add_column("XP")
     table.add_column("Status")
 
-    for mission_id, mission_class in missions.items():
-        info = mission_class.info
-
+    for mission_id, info in missions.items():
         if mission_id in state.missions_completed:
             status = "[green]✓ Complete[/green]"
         elif info.tier.value == state.tier.value:
@@ -208,6 +521,8 @@ def list_missions(state: GameState, track: str | None = None) -> None:
 
 def list_tracks() -> None:
     """List all available learning tracks."""
+    from rich.table import Table
+
     tracks = get_all_tracks()
 
     if not tracks:
@@ -221,7 +536,7 @@ def list_tracks() -> None:
     table.add_column("Missions")
 
     for track_id, track_info in tracks.items():
-        mission_count = len(get_missions_for_track(track_id))
+        mission_count = len(get_mission_info_for_track(track_id))
         table.add_row(
             track_id,
             track_info["name"],
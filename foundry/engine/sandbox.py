@@ -0,0 +1,208 @@
+"""Run learner scripts in a resource-limited subprocess."""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from foundry.engine.cpu import available_cpus, thread_env
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Wall-clock limit per run, in seconds
+DEFAULT_TIMEOUT = float(os.environ.get("FOUNDRY_RUN_TIMEOUT", 120))
+
+# CPU-time limit per run, in seconds (0 disables)
+DEFAULT_CPU_SECONDS = int(os.environ.get("FOUNDRY_RUN_CPU", 120))
+
+# Address-space limit per run, in MiB (0 disables); torch alone maps well over 1 GiB
+DEFAULT_MEMORY_MB = int(os.environ.get("FOUNDRY_RUN_MEMORY_MB", 4096))
+
+# Only the tail of the script's output is kept
+OUTPUT_LIMIT = 16 * 1024
+
+# The only variables learner scripts inherit; tokens and credentials stay behind
+SCRIPT_ENV_VARS = ("PATH", "HOME", "LANG", "LC_ALL", "LC_CTYPE", "TMPDIR", "TZ", "PYTHONPATH")
+
+
+@dataclass
+class ExecutionResult:
+    """Outcome of one script run."""
+    script: str
+    returncode: int | None
+    timed_out: bool
+    output: str  # Tail of combined stdout and stderr
+    seconds: float
+    threads: int | None = None  # Thread pool size allotted to the run
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def summary(self) -> str:
+        text = self._describe()
+        return f"{text} (cached)" if self.cached else text
+
+    def _describe(self) -> str:
+        if self.timed_out:
+            return f"{self.script} timed out after {self.seconds:.1f}s"
+        if self.returncode is None:
+            return self.output
+        if self.returncode < 0:
+            name = signal.Signals(-self.returncode).name
+            return f"{self.script} killed by {name} after {self.seconds:.1f}s"
+        return f"{self.script} exited {self.returncode} in {self.seconds:.1f}s"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _limit(cpu_seconds: int, memory_bytes: int):
+    """Build a preexec_fn applying rlimits in the child before exec."""
+    def apply() -> None:
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+        if cpu_seconds:
+            # SIGXCPU at the soft limit, SIGKILL at the hard one
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        if memory_bytes:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    return apply
+
+
+def script_env(threads: int, environ: dict[str, str] | None = None) -> dict[str, str]:
+    """Minimal environment for a learner script, taken from environ (default: ours)."""
+    environ = os.environ if environ is None else environ
+    return {
+        **{name: environ[name] for name in SCRIPT_ENV_VARS if name in environ},
+        **thread_env(threads),
+        "PYTHONUNBUFFERED": "1",
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+
+
+def _tail(f) -> str:
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - OUTPUT_LIMIT))
+    text = f.read().decode(errors="replace")
+    return f"...[truncated]\n{text}" if size > OUTPUT_LIMIT else text
+
+
+def run_script(
+    workspace: Path,
+    script: str = "train.py",
+    timeout: float = DEFAULT_TIMEOUT,
+    cpu_seconds: int = DEFAULT_CPU_SECONDS,
+    memory_mb: int = DEFAULT_MEMORY_MB,
+    threads: int | None = None,
+) -> ExecutionResult:
+    """
+    Run a Python script inside workspace with the given limits.
+
+    The script gets its own session so that on timeout the whole process
+    group (including anything it spawned) is killed. It sees only a
+    minimal environment (SCRIPT_ENV_VARS), never the caller's secrets.
+    Output goes to a
+    temporary file rather than a pipe, so a chatty script can neither
+    block on a full pipe nor grow our memory; only the tail is kept.
+    BLAS and OpenMP thread pools are capped at threads (default: every
+    usable CPU), so concurrent runs split the machine instead of each
+    starting a pool the size of it.
+
+    When the zygote is available the script is forked from it instead, with
+    the same limits, skipping interpreter startup and heavy imports.
+    """
+    from foundry.engine import zygote
+
+    threads = threads or available_cpus()
+    result = zygote.run(workspace, script, timeout, cpu_seconds, memory_mb, threads)
+    if result is not None:
+        return result
+
+    env = script_env(threads)
+    preexec = _limit(cpu_seconds, memory_mb * 1024 * 1024) if resource else None
+
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as out:
+        proc = subprocess.Popen(
+            [sys.executable, script],
+            cwd=workspace,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=out,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            preexec_fn=preexec,
+        )
+        try:
+            proc.wait(timeout=timeout)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            timed_out = True
+        # Also reaps anything the script left running in the background
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        proc.wait()
+        seconds = time.perf_counter() - start
+        output = _tail(out)
+
+    return ExecutionResult(
+        script=script,
+        returncode=None if timed_out else proc.returncode,
+        timed_out=timed_out,
+        output=output,
+        seconds=round(seconds, 3),
+        threads=threads,
+    )
+
+
+def run_mission_script(
+    mission,
+    workspace: Path,
+    use_cache: bool = True,
+    threads: int | None = None,
+) -> ExecutionResult | None:
+    """
+    Execute a mission's learner script so its outputs can be validated.
+
+    Declared outputs are removed first: only files the script actually
+    writes during this run count. If an identical workspace was already
+    run under the same limits and environment, the cached outputs are
+    restored instead. Returns None for missions without a script.
+    """
+    from foundry.engine.cache import RunCache, VerdictCache
+
+    if not mission.script:
+        return None
+    if not (workspace / mission.script).is_file():
+        return ExecutionResult(mission.script, None, False, f"{mission.script} not found", 0.0)
+
+    cache = key = None
+    if use_cache:
+        cache = RunCache()
+        limits = f"{DEFAULT_TIMEOUT}:{DEFAULT_CPU_SECONDS}:{DEFAULT_MEMORY_MB}"
+        # Shares the validators' file hash memo for this workspace
+        fingerprints = VerdictCache(mission, workspace)
+        key = cache.key(workspace, mission.script, mission.outputs, limits, fingerprints)
+        fingerprints.save()
+        hit = cache.restore(key, workspace, mission.outputs)
+        if hit is not None:
+            return ExecutionResult(**{**hit, "cached": True})
+
+    for name in mission.outputs:
+        (workspace / name).unlink(missing_ok=True)
+    result = run_script(workspace, mission.script, threads=threads)
+
+    # Timeouts and signals depend on machine load, so only clean exits are kept
+    if cache and not result.timed_out and result.returncode >= 0:
+        cache.put(key, workspace, mission.outputs, result.to_dict())
+    return result
@@ -0,0 +1,270 @@
+"""Local grading service - an asyncio HTTP job queue in front of the validators.
+
+Endpoints (JSON in, JSON out):
+
+    GET  /health          queue depth and worker count
+    GET  /missions        known mission ids
+    POST /jobs            {"mission_id", "workspace", "student"?} -> 202 {"id", ...}
+    GET  /jobs/<id>       job status, with the grading row once done
+    POST /grade           same body as /jobs, but waits and returns the row
+
+Grading runs in a long-lived process pool whose workers import every mission
+(and numpy) once at startup, so each request costs only the validation
+itself. Only the standard library is used; nothing leaves the machine.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from foundry.engine.base import get_all_mission_info, get_all_missions
+from foundry.engine.cpu import available_cpus, threads_per_job
+from foundry.engine.grading import grade_workspace
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Pending jobs beyond this are refused with 503 instead of queued
+QUEUE_SIZE = 10_000
+
+# Finished jobs kept for GET /jobs/<id>; the oldest are forgotten first
+JOB_HISTORY = 10_000
+
+_REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 503: "Service Unavailable",
+}
+_MAX_BODY = 1 << 20
+
+
+def _warm() -> None:
+    """Process pool initializer: import numpy and every mission module up front."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    get_all_missions()
+
+
+@dataclass
+class Job:
+    """A queued grading request."""
+    id: str
+    mission_id: str
+    workspace: str
+    student: str
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    result: dict | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "mission_id": self.mission_id,
+            "workspace": self.workspace,
+            "student": self.student,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+        }
+
+
+class HTTPError(Exception):
+    """An error response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class GradingService:
+    """Bounded job queue drained by a fixed pool of grading processes."""
+
+    def __init__(self, workers: int | None = None, use_cache: bool = True, run: bool = False):
+        self.workers = workers or available_cpus()
+        self.threads = threads_per_job(self.workers)
+        self.use_cache = use_cache
+        self.run = run
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self.running = 0
+        self._ids = itertools.count(1)
+        self._queue: asyncio.Queue[Job] | None = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def serve(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        socket_path: str | None = None,
+    ) -> None:
+        """
+        Start the workers and serve HTTP until cancelled. With run, submitted
+        scripts execute as this user, so only a Unix socket (owner-only) is
+        allowed: TCP has no authentication.
+        """
+        if self.run and not socket_path:
+            raise ValueError("Running learner scripts requires a Unix socket; TCP is unauthenticated")
+        self._queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        if socket_path:
+            umask = os.umask(0o077)  # Only this user may connect
+            try:
+                server = await asyncio.start_unix_server(self._handle, path=socket_path)
+            finally:
+                os.umask(umask)
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._pool.shutdown(cancel_futures=True)
+            if socket_path and os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+    def submit(self, body: dict) -> Job:
+        """Validate a request body and queue it."""
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+        mission_id = body.get("mission_id")
+        workspace = body.get("workspace")
+        if not isinstance(mission_id, str) or not isinstance(workspace, str):
+            raise HTTPError(400, "mission_id and workspace are required strings")
+        if mission_id not in get_all_mission_info():
+            raise HTTPError(404, f"Mission not found: {mission_id}")
+        if not Path(workspace).is_dir():
+            raise HTTPError(400, f"Workspace not found: {workspace}")
+
+        job = Job(
+            id=str(next(self._ids)),
+            mission_id=mission_id,
+            workspace=workspace,
+            student=str(body["student"]) if body.get("student") is not None else "",
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise HTTPError(503, "Grading queue is full, retry later") from None
+        self.jobs[job.id] = job
+        while len(self.jobs) > JOB_HISTORY:
+            oldest = next(iter(self.jobs.values()))
+            if oldest.status in ("queued", "running"):
+                break
+            self.jobs.popitem(last=False)
+        return job
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            self.running += 1
+            try:
+                job.result = await loop.run_in_executor(
+                    self._pool, grade_workspace,
+                    job.student, job.mission_id, Path(job.workspace),
+                    self.use_cache, self.run, self.threads,
+                )
+                job.status = "done"
+            except Exception as exc:
+                job.result = {"error": f"{type(exc).__name__}: {exc}"}
+                job.status = "failed"
+            finally:
+                self.running -= 1
+                job.finished_at = time.time()
+                job.done.set()
+                self._queue.task_done()
+
+    async def _route(self, method: str, path: str, body: dict | None) -> tuple[int, dict]:
+        if path == "/health":
+            return 200, {
+                "status": "ok",
+                "queued": self._queue.qsize(),
+                "running": self.running,
+                "workers": self.workers,
+            }
+        if path == "/missions":
+            return 200, {"missions": sorted(get_all_mission_info())}
+        if path in ("/jobs", "/grade"):
+            if method != "POST":
+                raise HTTPError(405, "Use POST")
+            job = self.submit({} if body is None else body)
+            if path == "/jobs":
+                return 202, job.to_dict()
+            await job.done.wait()
+            return 200, job.to_dict()
+        if path.startswith("/jobs/"):
+            job = self.jobs.get(path.removeprefix("/jobs/"))
+            if not job:
+                raise HTTPError(404, "Job not found")
+            return 200, job.to_dict()
+        raise HTTPError(404, f"No route for {path}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection (keep-alive aware)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                framed = False  # Whether the body was consumed, so the next request can follow
+                try:
+                    length = headers.get("content-length", "0")
+                    if not (length.isascii() and length.isdigit()):
+                        raise HTTPError(400, "Invalid Content-Length")
+                    length = int(length)
+                    if length > _MAX_BODY:
+                        raise HTTPError(413, "Request body too large")
+                    raw = await reader.readexactly(length) if length else b""
+                    framed = True
+                    try:
+                        body = json.loads(raw) if raw else None
+                    except json.JSONDecodeError:
+                        raise HTTPError(400, "Body must be JSON") from None
+                    status, payload = await self._route(method, target.split("?")[0], body)
+                except HTTPError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                    keep_alive = keep_alive and framed
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
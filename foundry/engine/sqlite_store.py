@@ -0,0 +1,162 @@
+"""SQLite state backend for multi-player (classroom) deployments."""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from foundry.engine.storage import StateBackend
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_id   TEXT PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    tier        TEXT NOT NULL,
+    xp          INTEGER NOT NULL DEFAULT 0,
+    state       TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_by_xp ON players (xp DESC);
+
+CREATE TABLE IF NOT EXISTS completions (
+    player_id    TEXT NOT NULL,
+    mission_id   TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (player_id, mission_id)
+);
+CREATE INDEX IF NOT EXISTS completions_by_mission ON completions (mission_id);
+"""
+
+
+class SQLiteBackend(StateBackend):
+    """
+    Many players in one SQLite database.
+
+    Each player's state is one row keyed by player id, with XP indexed for
+    leaderboards and completions indexed by mission id. The database runs
+    in WAL mode so readers never block the writer.
+    """
+
+    def __init__(self, path: Path, player_id: str):
+        self.path = path
+        self.player_id = player_id
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def lock(self, shared: bool = False) -> Iterator[None]:
+        """Hold a write transaction; WAL readers need no lock."""
+        if shared:
+            yield
+            return
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Join the transaction opened by lock(), or run in a new one."""
+        conn = self._connect()
+        if conn.in_transaction:
+            yield conn
+        else:
+            with self.lock():
+                yield conn
+
+    def load(self) -> tuple[dict | None, list[dict]]:
+        row = self._connect().execute(
+            "SELECT state FROM players WHERE player_id = ?", (self.player_id,)
+        ).fetchone()
+        return (json.loads(row[0]) if row else None), []
+
+    def _upsert(self, conn: sqlite3.Connection, state: dict) -> None:
+        conn.execute(
+            """
+            INSERT INTO players (player_id, player_name, tier, xp, state, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (player_id) DO UPDATE SET
+                player_name = excluded.player_name,
+                tier = excluded.tier,
+                xp = excluded.xp,
+                state = excluded.state,
+                updated_at = excluded.updated_at
+            """,
+            (
+                self.player_id,
+                state["player_name"],
+                state["tier"],
+                state["xp"],
+                json.dumps(state),
+                datetime.now().isoformat(),
+            ),
+        )
+
+    def record(self, state: dict, events: list[dict]) -> None:
+        with self._transaction() as conn:
+            self._upsert(conn, state)
+            conn.executemany(
+                "INSERT OR IGNORE INTO completions (player_id, mission_id, completed_at) "
+                "VALUES (?, ?, ?)",
+                [
+                    (self.player_id, event["mission_id"], event["at"])
+                    for event in events
+                    if event["type"] == "mission_completed"
+                ],
+            )
+
+    def save(self, state: dict) -> None:
+        with self._transaction() as conn:
+            self._upsert(conn, state)
+
+    def leaderboard(self, limit: int = 10, mission_id: str | None = None) -> list[dict]:
+        conn = self._connect()
+        if mission_id:
+            rows = conn.execute(
+                """
+                SELECT p.player_id, p.player_name, p.tier, p.xp
+                FROM completions c JOIN players p ON p.player_id = c.player_id
+                WHERE c.mission_id = ?
+                ORDER BY p.xp DESC LIMIT ?
+                """,
+                (mission_id, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT player_id, player_name, tier, xp FROM players ORDER BY xp DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+        counts = dict(conn.execute(
+            f"SELECT player_id, COUNT(*) FROM completions "
+            f"WHERE player_id IN ({','.join('?' * len(rows))}) GROUP BY player_id",
+            [row[0] for row in rows],
+        ).fetchall()) if rows else {}
+
+        return [
+            {
+                "player_id": player_id,
+                "player_name": name,
+                "tier": tier,
+                "xp": xp,
+                "missions": counts.get(player_id, 0),
+            }
+            for player_id, name, tier, xp in rows
+        ]
@@ -1,15 +1,50 @@
 """Player game state and persistence."""
 
+import getpass
 import json
+import os
 from pathlib import Path
+from typing import Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+from foundry.engine.journal import Journal
+from foundry.engine.storage import StateBackend
 from foundry.engine.tiers import Tier, TIER_INFO, get_next_tier
 
 
 SAVE_DIR = Path.home() / ".claude-foundry"
-SAVE_PATH = SAVE_DIR / "save.json"
+SAVE_PATH = SAVE_DIR / "save.json"  # Snapshot of the state
+JOURNAL_PATH = SAVE_DIR / "journal.jsonl"  # Events since the snapshot
+
+# Fold the journal into a fresh snapshot after this many events
+COMPACT_EVERY = 100
+
+# FOUNDRY_STATE_BACKEND=sqlite stores many players in one database
+# (FOUNDRY_STATE_DB, default SAVE_DIR/foundry.db), keyed by FOUNDRY_PLAYER
+BACKEND = os.environ.get("FOUNDRY_STATE_BACKEND", "journal")
+STATE_DB_PATH = Path(os.environ.get("FOUNDRY_STATE_DB", SAVE_DIR / "foundry.db"))
+
+_backend: StateBackend | None = None
+
+# GameState fields derived purely from journal events
+_JOURNAL_FIELDS = (
+    "tier", "xp", "current_track", "missions_completed", "current_mission", "journal_seq",
+)
+
+
+def get_backend() -> StateBackend:
+    """Return the configured state backend."""
+    global _backend
+    if _backend is None:
+        if BACKEND == "sqlite":
+            from foundry.engine.sqlite_store import SQLiteBackend
+
+            player_id = os.environ.get("FOUNDRY_PLAYER") or getpass.getuser()
+            _backend = SQLiteBackend(STATE_DB_PATH, player_id)
+        else:
+            _backend = Journal(JOURNAL_PATH, SAVE_PATH, compact_every=COMPACT_EVERY)
+    return _backend
 
 
 @dataclass
@@ -33,27 +68,128 @@ class GameState:
     total_models_trained: int = 0
     achievements: list[str] = field(default_factory=list)
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    journal_seq: int = 0  # Last journal event folded into this state
 
     @classmethod
     def load(cls) -> "GameState":
-        """Load game state from disk or create new."""
-        if SAVE_PATH.exists():
-            try:
-                data = json.loads(SAVE_PATH.read_text())
-                data["tier"] = Tier(data["tier"])
-                if data.get("current_mission"):
-                    data["current_mission"] = MissionProgress(**data["current_mission"])
-                return cls(**data)
-            except (json.JSONDecodeError, KeyError, TypeError):
-                pass
-        return cls()
+        """Load the latest snapshot and replay the journal on top of it."""
+        backend = get_backend()
+        try:
+            with backend.lock(shared=True):
+                data, events = backend.load()
+        except (json.JSONDecodeError, OSError):
+            data, events = None, []
 
-    def save(self) -> None:
-        """Persist game state to disk."""
-        SAVE_DIR.mkdir(parents=True, exist_ok=True)
+        state = cls._from_snapshot(data)
+        for event in events:
+            if event["seq"] > state.journal_seq:
+                state._apply(event)
+        return state
+
+    @classmethod
+    def _from_snapshot(cls, data: dict | None) -> "GameState":
+        """Build a state from a snapshot dict, or a fresh one if it is unusable."""
+        if not data:
+            return cls()
+        try:
+            data = dict(data)
+            data["tier"] = Tier(data["tier"])
+            if data.get("current_mission"):
+                data["current_mission"] = MissionProgress(**data["current_mission"])
+            return cls(**data)
+        except (KeyError, TypeError, ValueError):
+            return cls()
+
+    @classmethod
+    def leaderboard(cls, limit: int = 10, mission_id: str | None = None) -> list[dict]:
+        """Top players by XP (just this player on single-player backends)."""
+        rows = get_backend().leaderboard(limit, mission_id)
+        if rows is None:
+            state = cls.load()
+            if mission_id and mission_id not in state.missions_completed:
+                return []
+            rows = [{
+                "player_id": getpass.getuser(),
+                "player_name": state.player_name,
+                "tier": state.tier.value,
+                "xp": state.xp,
+                "missions": len(state.missions_completed),
+            }]
+        return rows
+
+    def to_dict(self) -> dict:
+        """Serialise the state as a JSON-compatible snapshot."""
         data = asdict(self)
         data["tier"] = self.tier.value
-        SAVE_PATH.write_text(json.dumps(data, indent=2))
+        return data
+
+    def save(self) -> None:
+        """Merge in concurrent changes, then write a full snapshot."""
+        backend = get_backend()
+        with backend.lock():
+            self._refresh()
+            backend.save(self.to_dict())
+
+    def _refresh(self) -> None:
+        """
+        Fold in what other processes recorded since this state was loaded.
+        Journal-derived fields follow the stored state; profile fields
+        (name, achievements, ...) keep this process's values.
+        Call with the backend lock held. An unreadable store counts as empty,
+        as in load().
+        """
+        try:
+            data, events = get_backend().load()
+        except (json.JSONDecodeError, OSError):
+            data, events = None, []
+        stored = GameState._from_snapshot(data)
+        if stored.journal_seq > self.journal_seq:
+            for name in _JOURNAL_FIELDS:
+                setattr(self, name, getattr(stored, name))
+        for event in events:
+            if event["seq"] > self.journal_seq:
+                self._apply(event)
+
+    def _transact(self, build: Callable[[], list[dict]]) -> None:
+        """
+        Record events as one read-modify-write cycle.
+        build() runs after concurrent changes are merged in, so it decides
+        against up-to-date state; the lock is held only for this cycle.
+        """
+        backend = get_backend()
+        with backend.lock():
+            self._refresh()
+            batch = []
+            for event in build():
+                event = {"seq": self.journal_seq + 1, "at": datetime.now().isoformat(), **event}
+                self._apply(event)
+                batch.append(event)
+            if batch:
+                backend.record(self.to_dict(), batch)
+
+    def _record(self, *events: dict) -> None:
+        """Apply events and append them to the journal as one durable batch."""
+        self._transact(lambda: list(events))
+
+    def _apply(self, event: dict) -> None:
+        """Fold a single journal event into the state."""
+        kind = event.get("type")
+        if kind == "track_set":
+            self.current_track = event["track_id"]
+        elif kind == "mission_started":
+            self.current_mission = MissionProgress(event["mission_id"], event["at"])
+        elif kind == "checkpoint_passed":
+            progress = self.current_mission
+            if progress and progress.mission_id == event["mission_id"]:
+                if event["checkpoint_id"] not in progress.checkpoints:
+                    progress.checkpoints.append(event["checkpoint_id"])
+        elif kind == "mission_completed":
+            if event["mission_id"] not in self.missions_completed:
+                self.missions_completed.append(event["mission_id"])
+            self.current_mission = None
+        elif kind == "xp_awarded":
+            self.add_xp(event["amount"])
+        self.journal_seq = event["seq"]
 
     def add_xp(self, amount: int) -> bool:
         """Add XP and check for tier advancement. Returns True if tier changed."""
@@ -66,15 +202,34 @@ class GameState:
                 return True
         return False
 
+    def start_mission(self, mission_id: str) -> None:
+        """Record that a mission was started."""
+        self._record({"type": "mission_started", "mission_id": mission_id})
+
+    def pass_checkpoints(self, mission_id: str, checkpoint_ids: list[str]) -> None:
+        """Record newly passed checkpoints of the current mission."""
+        def build() -> list[dict]:
+            progress = self.current_mission
+            if not progress or progress.mission_id != mission_id:
+                return []
+            return [
+                {"type": "checkpoint_passed", "mission_id": mission_id, "checkpoint_id": cp}
+                for cp in checkpoint_ids
+                if cp not in progress.checkpoints
+            ]
+
+        progress = self.current_mission
+        if progress and progress.mission_id == mission_id:
+            if any(cp not in progress.checkpoints for cp in checkpoint_ids):
+                self._transact(build)
+
     def complete_mission(self, mission_id: str, xp_reward: int) -> None:
-        """Mark a mission as completed."""
-        if mission_id not in self.missions_completed:
-            self.missions_completed.append(mission_id)
-        self.add_xp(xp_reward)
-        self.current_mission = None
-        self.save()
+        """Mark a mission as completed (XP is awarded only once)."""
+        self._transact(lambda: [] if mission_id in self.missions_completed else [
+            {"type": "mission_completed", "mission_id": mission_id},
+            {"type": "xp_awarded", "amount": xp_reward},
+        ])
 
     def set_track(self, track_id: str) -> None:
         """Set the current learning track."""
-        self.current_track = track_id
-        self.save()
+        self._record({"type": "track_set", "track_id": track_id})
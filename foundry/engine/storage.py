@@ -0,0 +1,43 @@
+"""Pluggable persistence backends for player state."""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StateBackend(ABC):
+    """
+    Where GameState lives.
+
+    State is a snapshot dict plus journal events recorded since it was
+    taken. Backends decide how both are stored; GameState only folds the
+    events into the snapshot.
+    """
+
+    @contextmanager
+    def lock(self, shared: bool = False) -> Iterator[None]:
+        """
+        Serialise read-modify-write cycles across processes.
+        GameState holds this only while merging and recording, never across
+        a whole command.
+        """
+        yield
+
+    @abstractmethod
+    def load(self) -> tuple[dict | None, list[dict]]:
+        """Return the latest snapshot (or None) and the events to replay on top of it."""
+
+    @abstractmethod
+    def record(self, state: dict, events: list[dict]) -> None:
+        """Durably record events; state is the snapshot with them applied."""
+
+    @abstractmethod
+    def save(self, state: dict) -> None:
+        """Persist a full snapshot."""
+
+    def leaderboard(self, limit: int = 10, mission_id: str | None = None) -> list[dict] | None:
+        """
+        Top players by XP, optionally only those who completed a mission.
+        Returns None for single-player backends.
+        """
+        return None
@@ -0,0 +1,81 @@
+"""Per-learner dataset variants and the workspace marker that records them."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from foundry.engine.datasets import dataset_key
+
+# Hidden, so run-cache keys and learner-facing listings ignore it
+VARIANT_FILE = ".foundry.json"
+
+
+def learner_seed(cohort_seed: int, player: str) -> int:
+    """
+    Dataset seed for one learner of a cohort: stable for the same cohort seed
+    and player, unrelated between players (and between cohorts).
+    """
+    digest = hashlib.sha256(f"{cohort_seed}\0{player}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") >> 1  # Non-negative, fits an int64
+
+
+def variant_id(mission) -> str:
+    """Identifier of the dataset a mission generates with its current parameters."""
+    return dataset_key(mission.info.id, mission.dataset_version, mission.get_params())
+
+
+def write_variant(workspace: Path, mission, player: str | None = None) -> dict:
+    """Record which dataset variant workspace was set up with."""
+    marker = {
+        "mission_id": mission.info.id,
+        "player": player,
+        "dataset_version": mission.dataset_version,
+        "params": mission.get_params(),
+        "variant": variant_id(mission),
+    }
+    tmp = workspace / f"{VARIANT_FILE}.tmp"
+    tmp.write_text(json.dumps(marker, indent=2) + "\n")
+    os.replace(tmp, workspace / VARIANT_FILE)
+    return marker
+
+
+def read_variant(workspace: Path) -> dict | None:
+    """The workspace's variant marker, or None if it has none (or an unreadable one)."""
+    try:
+        marker = json.loads((workspace / VARIANT_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    return marker if isinstance(marker, dict) else None
+
+
+def apply_variant(mission, workspace: Path) -> dict | None:
+    """
+    Load the workspace's variant into mission, so validators see the
+    parameters its data was generated with. Returns the marker.
+    """
+    marker = read_variant(workspace)
+    if marker and marker.get("mission_id") == mission.info.id:
+        params = marker.get("params") or {}
+        mission.params = {k: v for k, v in params.items() if k in mission.dataset_params}
+    return marker
+
+
+def variant_problem(mission, marker: dict | None, expected_seed: int | None = None) -> str | None:
+    """
+    Why a workspace's variant can't be trusted, or None if it can: the marker
+    must be intact (its id matches its parameters), current, and - given
+    expected_seed - carry that seed.
+    """
+    if marker is None:
+        return "No variant marker; the workspace was not provisioned" if expected_seed is not None else None
+    if marker.get("mission_id") != mission.info.id:
+        return f"Variant marker belongs to {marker.get('mission_id')}"
+    if marker.get("dataset_version") != mission.dataset_version:
+        return (f"Variant is from dataset version {marker.get('dataset_version')}, "
+                f"now {mission.dataset_version}")
+    if marker.get("variant") != variant_id(mission):
+        return "Variant marker does not match its parameters"
+    if expected_seed is not None and mission.get_params().get("seed") != expected_seed:
+        return f"Variant was provisioned for {marker.get('player') or 'another learner'}"
+    return None
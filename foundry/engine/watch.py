@@ -0,0 +1,196 @@
+"""Workspace file watching - inotify via ctypes, with a polling fallback."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from foundry.engine.base import Checkpoint
+
+# Quiet period that ends a burst of writes (editors often save in several steps)
+DEBOUNCE_SECONDS = 0.3
+
+# Scan interval for the polling fallback
+POLL_INTERVAL = 1.0
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+_EVENT = struct.Struct("iIII")
+
+
+def _ignored(rel: str) -> bool:
+    """Skip editor swap files, hidden files and bytecode caches."""
+    parts = Path(rel).parts
+    return any(p.startswith(".") or p == "__pycache__" for p in parts) or rel.endswith("~")
+
+
+def _list_files(root: Path) -> set[str]:
+    """All watchable files under root, relative to it."""
+    files = set()
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            rel = os.path.relpath(os.path.join(dirpath, name), root)
+            if not _ignored(rel):
+                files.add(rel)
+    return files
+
+
+def affected_checkpoints(checkpoints: list[Checkpoint], changed: set[str]) -> list[Checkpoint]:
+    """Checkpoints that must be re-validated after the given files changed."""
+    return [cp for cp in checkpoints if any(cp.depends_on(rel) for rel in changed)]
+
+
+class Watcher(ABC):
+    """Blocks until files under a workspace change."""
+
+    def __init__(self, root: Path, debounce: float = DEBOUNCE_SECONDS):
+        self.root = root
+        self.debounce = debounce
+
+    @abstractmethod
+    def wait(self) -> set[str]:
+        """Block until a burst of changes settles; return the changed relative paths."""
+
+    def close(self) -> None:
+        """Release any OS resources."""
+
+
+class InotifyWatcher(Watcher):
+    """Linux inotify watcher; sleeps in select() so it costs no CPU while idle."""
+
+    def __init__(self, root: Path, debounce: float = DEBOUNCE_SECONDS):
+        super().__init__(root, debounce)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._dirs: dict[int, str] = {}
+        for dirpath, _, _ in os.walk(root):
+            self._add_watch(dirpath)
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def _drain(self) -> set[str]:
+        """Read all queued events without blocking."""
+        changed: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = os.fsdecode(data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0"))
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; assume everything changed
+                    changed |= _list_files(self.root)
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, name)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # Watch the new directory and pick up files written before the watch
+                        for dirpath, _, _ in os.walk(path):
+                            self._add_watch(dirpath)
+                        changed |= {os.path.join(os.path.relpath(path, self.root), f)
+                                    for f in _list_files(Path(path))}
+                    continue
+                rel = os.path.relpath(path, self.root)
+                if not _ignored(rel):
+                    changed.add(rel)
+
+    def wait(self) -> set[str]:
+        changed: set[str] = set()
+        while not changed:
+            select.select([self._fd], [], [])
+            changed |= self._drain()
+        while select.select([self._fd], [], [], self.debounce)[0]:
+            changed |= self._drain()
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher(Watcher):
+    """Portable watcher that compares (mtime, size) snapshots."""
+
+    def __init__(
+        self,
+        root: Path,
+        debounce: float = DEBOUNCE_SECONDS,
+        interval: float = POLL_INTERVAL,
+    ):
+        super().__init__(root, debounce)
+        self.interval = interval
+        self._state = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        state = {}
+        for rel in _list_files(self.root):
+            try:
+                stat = (self.root / rel).stat()
+            except OSError:
+                continue
+            state[rel] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def _diff(self) -> set[str]:
+        current = self._scan()
+        changed = {rel for rel in current.keys() | self._state.keys()
+                   if current.get(rel) != self._state.get(rel)}
+        self._state = current
+        return changed
+
+    def wait(self) -> set[str]:
+        changed: set[str] = set()
+        while not changed:
+            time.sleep(self.interval)
+            changed = self._diff()
+        while True:
+            time.sleep(self.debounce)
+            more = self._diff()
+            if not more:
+                return changed
+            changed |= more
+
+
+def open_watcher(root: Path, debounce: float = DEBOUNCE_SECONDS) -> Watcher:
+    """Open the best available watcher (FOUNDRY_WATCH=poll forces polling)."""
+    if os.environ.get("FOUNDRY_WATCH") != "poll":
+        try:
+            return InotifyWatcher(root, debounce)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, debounce)
@@ -0,0 +1,72 @@
+"""Per-pass workspace snapshot shared by checkpoint validators."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+class WorkspaceSnapshot:
+    """
+    Lazily loaded, memoized view of a mission workspace.
+
+    One snapshot is built per check pass and shared by every validator, so
+    each file is read (and each JSON document parsed) at most once, even
+    when validators run on several threads. Errors are memoized too.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._values: dict[tuple[str, str], tuple[bool, Any]] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot cross process boundaries; each process starts fresh
+        return {"root": self.root}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["root"])
+
+    def _memo(self, kind: str, rel: str, load: Callable[[], Any]) -> Any:
+        key = (kind, rel)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                try:
+                    self._values[key] = (True, load())
+                except Exception as exc:
+                    self._values[key] = (False, exc)
+        ok, value = self._values[key]
+        if not ok:
+            raise value
+        return value
+
+    def path(self, rel: str) -> Path:
+        """Absolute path of a workspace file."""
+        return self.root / rel
+
+    def exists(self, rel: str) -> bool:
+        """Whether a workspace file exists."""
+        return self._memo("exists", rel, self.path(rel).exists)
+
+    def read_bytes(self, rel: str) -> bytes:
+        """Raw file contents."""
+        return self._memo("bytes", rel, self.path(rel).read_bytes)
+
+    def text(self, rel: str) -> str:
+        """File contents decoded as UTF-8."""
+        return self._memo("text", rel, lambda: self.read_bytes(rel).decode())
+
+    def json(self, rel: str) -> Any:
+        """Parsed JSON document. Raises json.JSONDecodeError on bad input."""
+        return self._memo("json", rel, lambda: json.loads(self.text(rel)))
+
+    def array(self, rel: str) -> Any:
+        """Read-only memory-mapped .npy array."""
+        import numpy as np
+
+        return self._memo(
+            "array", rel, lambda: np.load(self.path(rel), mmap_mode="r", allow_pickle=False)
+        )
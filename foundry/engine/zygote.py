@@ -0,0 +1,344 @@
+"""
+Warm interpreter for learner scripts.
+
+Importing torch and artlib costs seconds, dwarfing the tiny ART mission
+scripts. The zygote is a background process that imports them once and
+then forks per run: for each request on its Unix socket it forks a
+handler, which forks the script process itself (new session, rlimits,
+output redirected to a temp file) and enforces the wall-clock timeout.
+The script therefore starts with every heavy module already in memory.
+
+Clients start the zygote on demand; it exits after IDLE_TIMEOUT seconds
+without requests. FOUNDRY_ZYGOTE=0 falls back to a plain subprocess.
+"""
+
+import hashlib
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+from foundry import __version__
+from foundry.engine.cache import _environment_stamp
+from foundry.engine.cpu import limit_threads
+from foundry.engine.sandbox import SCRIPT_ENV_VARS, ExecutionResult, _limit, _tail, resource, script_env
+from foundry.engine.state import SAVE_DIR
+
+ENABLED = (
+    os.environ.get("FOUNDRY_ZYGOTE", "1") != "0"
+    and hasattr(os, "fork")
+    and hasattr(socket, "AF_UNIX")
+    and fcntl is not None
+)
+
+# Modules imported once by the zygote and inherited by every script
+PRELOAD = tuple(filter(None, os.environ.get("FOUNDRY_ZYGOTE_PRELOAD", "numpy,torch,artlib").split(",")))
+
+# Seconds without requests before the zygote exits
+IDLE_TIMEOUT = float(os.environ.get("FOUNDRY_ZYGOTE_IDLE", 600))
+
+# How long a client waits for a freshly started zygote to accept
+START_TIMEOUT = 30.0
+
+# One zygote per interpreter, preloaded package versions, foundry version and
+# zygote source, so upgrades never reuse a stale one (and the run cache, keyed on
+# the same versions, never stores results from one)
+_TAG = hashlib.sha256(
+    f"{__version__}\0{_environment_stamp()}\0{os.stat(__file__).st_mtime_ns}".encode()
+).hexdigest()[:12]
+SOCKET_PATH = SAVE_DIR / f"zygote-{_TAG}.sock"
+
+
+def _preload() -> None:
+    for name in PRELOAD:
+        try:
+            __import__(name)
+        except Exception:
+            pass  # Scripts that need it will fail the same way on their own
+
+
+def _reseed() -> None:
+    """Forked children share the zygote's RNG state; give each run fresh entropy."""
+    import random
+
+    random.seed()
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed()
+    if "torch" in sys.modules:
+        sys.modules["torch"].seed()
+
+
+def _exec_script(
+    workspace: str,
+    script: str,
+    out_fd: int,
+    cpu_seconds: int,
+    memory_mb: int,
+    threads: int,
+    env: dict[str, str],
+) -> None:
+    """Body of the script process. Never returns."""
+    code = 1
+    try:
+        os.setsid()
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD, signal.SIGPIPE):
+            signal.signal(sig, signal.SIG_DFL)
+        if resource:
+            _limit(cpu_seconds, memory_mb * 1024 * 1024)()
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(out_fd, 1)
+        os.dup2(out_fd, 2)
+        # Nothing else of ours - the zygote lock, the client connection - may
+        # reach the script, which could otherwise forge its own result
+        os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+        os.chdir(workspace)
+        # The caller's environment, not that of whichever client started us
+        os.environ.clear()
+        os.environ.update(env)
+        sys.argv = [script]
+        sys.path.insert(0, workspace)
+        # The preloaded runtimes read their thread env vars long ago
+        limit_threads(threads)
+        _reseed()
+
+        import runpy
+
+        path = os.path.join(workspace, script)
+        try:
+            runpy.run_path(path, run_name="__main__")
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                code = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)
+        except BaseException as exc:
+            # Start the traceback at the script, as a plain `python train.py` would
+            tb = exc.__traceback__
+            while tb and tb.tb_frame.f_code.co_filename != path:
+                tb = tb.tb_next
+            traceback.print_exception(type(exc), exc, tb or exc.__traceback__)
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _wait(pid: int, timeout: float) -> int | None:
+    """Wait for a child up to timeout seconds; return its status, or None on timeout."""
+    deadline = time.monotonic() + timeout
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    try:
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                return status
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if pidfd is not None:
+                select.select([pidfd], [], [], remaining)
+            else:
+                time.sleep(min(remaining, 0.005))
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _execute(request: dict) -> dict:
+    """Run one script in a forked process and collect its result."""
+    script = request["script"]
+    with tempfile.TemporaryFile() as out:
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            _exec_script(request["workspace"], script, out.fileno(),
+                         request["cpu_seconds"], request["memory_mb"], request["threads"],
+                         request["env"])
+        status = _wait(pid, request["timeout"])
+        timed_out = status is None
+        try:
+            os.killpg(pid, signal.SIGKILL)  # Also reaps anything it left running
+        except OSError:
+            pass
+        if timed_out:
+            _, status = os.waitpid(pid, 0)
+        seconds = time.perf_counter() - start
+        output = _tail(out)
+
+    return ExecutionResult(
+        script=script,
+        returncode=None if timed_out else os.waitstatus_to_exitcode(status),
+        timed_out=timed_out,
+        output=output,
+        seconds=round(seconds, 3),
+        threads=request["threads"],
+    ).to_dict()
+
+
+def _handle(conn: socket.socket) -> None:
+    conn.settimeout(None)
+    with conn, conn.makefile("rb") as reader:
+        request = json.loads(reader.readline())
+        try:
+            reply = {"result": _execute(request)}
+        except Exception as exc:
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        conn.sendall(json.dumps(reply).encode() + b"\n")
+
+
+def serve(path: Path = SOCKET_PATH, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """Run the zygote until it has been idle for idle_timeout seconds."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(path.with_suffix(".lock"), os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return  # Another zygote is already serving this path
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        path.unlink(missing_ok=True)
+        umask = os.umask(0o077)
+        try:
+            listener.bind(str(path))
+        finally:
+            os.umask(umask)
+        # Clients may connect and queue while the preload runs
+        listener.listen(128)
+        _preload()
+        listener.settimeout(1.0)
+
+        children: set[int] = set()
+        last_request = time.monotonic()
+        while True:
+            for pid in list(children):
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    children.discard(pid)
+            if not children and time.monotonic() - last_request > idle_timeout:
+                return
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            last_request = time.monotonic()
+            pid = os.fork()
+            if pid == 0:
+                listener.close()
+                try:
+                    _handle(conn)
+                finally:
+                    os._exit(0)
+            conn.close()
+            children.add(pid)
+    finally:
+        listener.close()
+        path.unlink(missing_ok=True)
+        os.close(lock_fd)
+
+
+def _spawn() -> None:
+    """Start a detached zygote in the background."""
+    import foundry
+
+    # Keep foundry importable without leaking the caller's cwd onto the scripts' sys.path
+    package_root = str(Path(foundry.__file__).resolve().parent.parent)
+    pythonpath = os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")]))
+    # Scripts get their environment per request; keep the caller's secrets out of
+    # the zygote entirely (a forked child could still read them in /proc/self/environ)
+    env = {
+        name: value for name, value in os.environ.items()
+        if name in SCRIPT_ENV_VARS or name.startswith("FOUNDRY_")
+    }
+    subprocess.Popen(
+        [sys.executable, "-m", "foundry.engine.zygote"],
+        cwd="/",
+        env={**env, "PYTHONPATH": pythonpath},
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+def _connect(deadline: float) -> socket.socket | None:
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(SOCKET_PATH))
+            return sock
+        except OSError:
+            sock.close()
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.05)
+
+
+def run(
+    workspace: Path,
+    script: str,
+    timeout: float,
+    cpu_seconds: int,
+    memory_mb: int,
+    threads: int,
+) -> ExecutionResult | None:
+    """Run a script through the zygote, starting one if needed; None if unavailable."""
+    if not ENABLED:
+        return None
+    sock = _connect(deadline=0)
+    if sock is None:
+        try:
+            _spawn()
+        except OSError:
+            return None
+        sock = _connect(deadline=time.monotonic() + START_TIMEOUT)
+        if sock is None:
+            return None
+
+    request = {
+        "workspace": str(Path(workspace).resolve()),
+        "script": script,
+        "timeout": timeout,
+        "cpu_seconds": cpu_seconds,
+        "memory_mb": memory_mb,
+        "threads": threads,
+        "env": script_env(threads),
+    }
+    try:
+        with sock, sock.makefile("rb") as reader:
+            # Allow for a zygote that is still preloading
+            sock.settimeout(timeout + START_TIMEOUT)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            reply = json.loads(reader.readline())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if "result" not in reply:
+        return None
+    return ExecutionResult(**reply["result"])
+
+
+def main() -> None:
+    serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from pathlib import Path
 import json
 import numpy as np
 
+from foundry.engine.datasets import write_json
 from foundry.engine.tiers import Tier
 from foundry.engine.base import (
     Mission,
@@ -54,6 +55,196 @@ Run `nf check` in the workspace to validate your progress.
 Good luck, Apprentice. May your patterns resonate.
 '''
 
+# Base patterns for digits 0-9 (8x8 binary)
+BASE_PATTERNS = {
+    0: [
+        "00111100",
+        "01000010",
+        "01000010",
+        "01000010",
+        "01000010",
+        "01000010",
+        "01000010",
+        "00111100",
+    ],
+    1: [
+        "00011000",
+        "00101000",
+        "01001000",
+        "00001000",
+        "00001000",
+        "00001000",
+        "00001000",
+        "01111110",
+    ],
+    2: [
+        "00111100",
+        "01000010",
+        "00000010",
+        "00000100",
+        "00001000",
+        "00010000",
+        "00100000",
+        "01111110",
+    ],
+    3: [
+        "00111100",
+        "01000010",
+        "00000010",
+        "00011100",
+        "00000010",
+        "00000010",
+        "01000010",
+        "00111100",
+    ],
+    4: [
+        "00000100",
+        "00001100",
+        "00010100",
+        "00100100",
+        "01000100",
+        "01111110",
+        "00000100",
+        "00000100",
+    ],
+    5: [
+        "01111110",
+        "01000000",
+        "01000000",
+        "01111100",
+        "00000010",
+        "00000010",
+        "01000010",
+        "00111100",
+    ],
+    6: [
+        "00111100",
+        "01000010",
+        "01000000",
+        "01111100",
+        "01000010",
+        "01000010",
+        "01000010",
+        "00111100",
+    ],
+    7: [
+        "01111110",
+        "00000010",
+        "00000100",
+        "00001000",
+        "00010000",
+        "00010000",
+        "00010000",
+        "00010000",
+    ],
+    8: [
+        "00111100",
+        "01000010",
+        "01000010",
+        "00111100",
+        "01000010",
+        "01000010",
+        "01000010",
+        "00111100",
+    ],
+    9: [
+        "00111100",
+        "01000010",
+        "01000010",
+        "00111110",
+        "00000010",
+        "00000010",
+        "01000010",
+        "00111100",
+    ],
+}
+
+
+# Data readme for each pattern file format
+PATTERNS_README = {
+    "json": '''# Pattern Data Format
+
+This file contains binary representations of handwritten digits (0-9).
+
+## Structure
+
+- patterns.json contains:
+  - "patterns": List of 64-element binary arrays (8x8 flattened)
+  - "labels": True digit label for each pattern (0-9)
+  - "shape": Original 2D shape [8, 8]
+
+## Loading Example
+
+```python
+import json
+import numpy as np
+
+with open("patterns.json") as f:
+    data = json.load(f)
+
+patterns = np.array(data["patterns"])  # Shape: (N, 64)
+labels = np.array(data["labels"])      # Shape: (N,)
+```
+
+## Notes
+
+- Patterns are binary (0 or 1 values only)
+- Each digit has multiple slightly different examples
+- Some patterns may have noise/corruption
+''',
+    "npz": '''# Pattern Data Format
+
+This file contains binary representations of handwritten digits (0-9).
+
+## Structure
+
+- patterns.npz contains:
+  - "bits": Patterns packed 8 per byte with np.packbits, shape (N, 8)
+  - "labels": True digit label for each pattern (0-9), shape (N,)
+  - "shape": Original 2D shape [8, 8]
+
+## Loading Example
+
+```python
+import numpy as np
+
+with np.load("patterns.npz") as data:
+    patterns = np.unpackbits(data["bits"], axis=1)  # Shape: (N, 64)
+    labels = data["labels"]                         # Shape: (N,)
+```
+
+## Notes
+
+- Patterns are binary (0 or 1 values only)
+- Each digit has multiple slightly different examples
+- Some patterns may have noise/corruption
+''',
+}
+
+PATTERN_SHAPE = (8, 8)
+
+
+def save_patterns_npz(path: Path, patterns: np.ndarray, labels: np.ndarray) -> None:
+    """Save binary patterns packed 8 bits per byte, with labels and shape."""
+    np.savez(
+        path,
+        bits=np.packbits(patterns, axis=1),
+        labels=labels.astype(np.uint8),
+        shape=np.array(PATTERN_SHAPE),
+    )
+
+
+def load_patterns(data_dir: Path) -> tuple[np.ndarray, np.ndarray]:
+    """Load (patterns, labels) from patterns.npz if present, else patterns.json."""
+    npz_path = data_dir / "patterns.npz"
+    if npz_path.exists():
+        with np.load(npz_path) as data:
+            n_bits = int(np.prod(data["shape"]))
+            return np.unpackbits(data["bits"], axis=1, count=n_bits), data["labels"].astype(np.int64)
+    data = json.loads((data_dir / "patterns.json").read_text())
+    return np.array(data["patterns"], dtype=np.uint8), np.array(data["labels"])
+
+
 MISSION_INFO = MissionInfo(
     id="m01_first_resonance",
     title="First Resonance",
@@ -72,6 +263,10 @@ class FirstResonanceMission(Mission):
     """First mission teaching file reading and ART1 basics."""
 
     info = MISSION_INFO
+    script = "train.py"
+    outputs = ("results.json",)
+    dataset_version = 3
+    dataset_params = {"n_per_digit": 5, "noise_rate": 0.03, "format": "json", "seed": 42}
 
     def __init__(self):
         self.workspace: Path | None = None
@@ -82,24 +277,28 @@ class FirstResonanceMission(Mission):
                 description="Read and understand the pattern files",
                 hint="Try: 'Read data/readme.txt' or 'What's in the data folder?'",
                 status=CheckpointStatus.AVAILABLE,
+                inputs=["data/readme.txt", "data/patterns.*"],
             ),
             Checkpoint(
                 id="load_patterns",
                 title="Load the Patterns",
                 description="Create code that loads patterns into numpy arrays",
                 hint="Create train.py with numpy array loading logic",
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="configure_art1",
                 title="Configure ART1",
                 description="Initialize ART1 with appropriate parameters",
                 hint="Import from artlib: from artlib import ART1",
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="train_model",
                 title="Train & Classify",
                 description="Achieve >80% clustering purity",
                 hint="Write results to results.json with 'purity' key",
+                inputs=["results.json"],
             ),
         ]
 
@@ -110,177 +309,69 @@ class FirstResonanceMission(Mission):
         data_dir = workspace / "data"
         data_dir.mkdir(exist_ok=True)
 
-        # Generate and save patterns
-        patterns, labels = self._generate_digit_patterns()
-        patterns_data = {
-            "patterns": patterns.tolist(),
-            "labels": labels.tolist(),
-            "shape": [8, 8],
-            "description": "Binary digit patterns 0-9",
-        }
-        (data_dir / "patterns.json").write_text(json.dumps(patterns_data, indent=2))
+        # Generated patterns come from the shared dataset store; drop any left
+        # over in the other format, which load_patterns would otherwise prefer
+        for stale in data_dir.glob("patterns.*"):
+            stale.unlink()
+        self.install_dataset(data_dir)
 
         # Write readme
-        readme = '''# Pattern Data Format
-
-This file contains binary representations of handwritten digits (0-9).
-
-## Structure
-
-- patterns.json contains:
-  - "patterns": List of 64-element binary arrays (8x8 flattened)
-  - "labels": True digit label for each pattern (0-9)
-  - "shape": Original 2D shape [8, 8]
-
-## Loading Example
-
-```python
-import json
-import numpy as np
-
-with open("patterns.json") as f:
-    data = json.load(f)
-
-patterns = np.array(data["patterns"])  # Shape: (N, 64)
-labels = np.array(data["labels"])      # Shape: (N,)
-```
-
-## Notes
-
-- Patterns are binary (0 or 1 values only)
-- Each digit has multiple slightly different examples
-- Some patterns may have noise/corruption
-'''
+        readme = PATTERNS_README[self.get_params()["format"]]
         (data_dir / "readme.txt").write_text(readme)
 
         # Write instructions
         (workspace / "MISSION.md").write_text(INSTRUCTIONS)
 
-    def _generate_digit_patterns(self) -> tuple[np.ndarray, np.ndarray]:
-        """Generate binary 8x8 digit patterns."""
-        # Base patterns for digits 0-9 (8x8 binary)
-        base_patterns = {
-            0: [
-                "00111100",
-                "01000010",
-                "01000010",
-                "01000010",
-                "01000010",
-                "01000010",
-                "01000010",
-                "00111100",
-            ],
-            1: [
-                "00011000",
-                "00101000",
-                "01001000",
-                "00001000",
-                "00001000",
-                "00001000",
-                "00001000",
-                "01111110",
-            ],
-            2: [
-                "00111100",
-                "01000010",
-                "00000010",
-                "00000100",
-                "00001000",
-                "00010000",
-                "00100000",
-                "01111110",
-            ],
-            3: [
-                "00111100",
-                "01000010",
-                "00000010",
-                "00011100",
-                "00000010",
-                "00000010",
-                "01000010",
-                "00111100",
-            ],
-            4: [
-                "00000100",
-                "00001100",
-                "00010100",
-                "00100100",
-                "01000100",
-                "01111110",
-                "00000100",
-                "00000100",
-            ],
-            5: [
-                "01111110",
-                "01000000",
-                "01000000",
-                "01111100",
-                "00000010",
-                "00000010",
-                "01000010",
-                "00111100",
-            ],
-            6: [
-                "00111100",
-                "01000010",
-                "01000000",
-                "01111100",
-                "01000010",
-                "01000010",
-                "01000010",
-                "00111100",
-            ],
-            7: [
-                "01111110",
-                "00000010",
-                "00000100",
-                "00001000",
-                "00010000",
-                "00010000",
-                "00010000",
-                "00010000",
-            ],
-            8: [
-                "00111100",
-                "01000010",
-                "01000010",
-                "00111100",
-                "01000010",
-                "01000010",
-                "01000010",
-                "00111100",
-            ],
-            9: [
-                "00111100",
-                "01000010",
-                "01000010",
-                "00111110",
-                "00000010",
-                "00000010",
-                "01000010",
-                "00111100",
-            ],
-        }
-
-        patterns = []
-        labels = []
-
-        rng = np.random.default_rng(42)
-
-        for digit, rows in base_patterns.items():
-            # Convert base pattern to array
-            base = np.array([[int(c) for c in row] for row in rows]).flatten()
-
-            # Add 5 variants per digit (some with noise)
-            for i in range(5):
-                pattern = base.copy()
-                if i > 0:  # Add some noise to variants
-                    noise_idx = rng.choice(64, size=rng.integers(1, 4), replace=False)
-                    pattern[noise_idx] = 1 - pattern[noise_idx]
-                patterns.append(pattern)
-                labels.append(digit)
-
-        return np.array(patterns), np.array(labels)
+    def check_params(self, params: dict) -> None:
+        """Reject pattern counts, noise rates and formats the generator can't use."""
+        if params["n_per_digit"] < 1:
+            raise ValueError(f"n_per_digit must be at least 1, got {params['n_per_digit']}")
+        if not 0 <= params["noise_rate"] <= 1:
+            raise ValueError(f"noise_rate must be between 0 and 1, got {params['noise_rate']}")
+        if params["format"] not in PATTERNS_README:
+            raise ValueError(f"format must be one of: {', '.join(PATTERNS_README)}")
+        if params["seed"] < 0:
+            raise ValueError(f"seed must be non-negative, got {params['seed']}")
+
+    def build_dataset(self, data_dir: Path) -> None:
+        """Generate and save the digit patterns as patterns.json or packed patterns.npz."""
+        params = self.get_params()
+        patterns, labels = self._generate_digit_patterns(
+            params["n_per_digit"], params["noise_rate"], params["seed"]
+        )
+        if params["format"] == "npz":
+            save_patterns_npz(data_dir / "patterns.npz", patterns, labels)
+            return
+        write_json(data_dir / "patterns.json", {
+            "patterns": patterns,
+            "labels": labels,
+            "shape": list(PATTERN_SHAPE),
+            "description": "Binary digit patterns 0-9",
+        })
+
+    def _generate_digit_patterns(
+        self,
+        n_per_digit: int = 5,
+        noise_rate: float = 0.03,
+        seed: int = 42,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate n_per_digit binary 8x8 variants of each digit, grouped by digit.
+        Every bit of every variant but the first is flipped with probability
+        noise_rate, drawn as a single random mask.
+        """
+        rng = np.random.default_rng(seed)
+
+        text = "".join("".join(rows) for rows in BASE_PATTERNS.values())
+        base = (np.frombuffer(text.encode(), dtype=np.uint8) - ord("0")).reshape(10, 64)
+
+        patterns = np.repeat(base, n_per_digit, axis=0)
+        flips = rng.random(patterns.shape, dtype=np.float32) < noise_rate
+        flips[::n_per_digit] = False  # Keep one clean example of each digit
+        patterns ^= flips
+        labels = np.repeat(np.arange(10), n_per_digit)
+
+        return patterns, labels
 
     def get_checkpoints(self) -> list[Checkpoint]:
         """Return list of mission checkpoints."""
@@ -291,38 +382,37 @@ labels = np.array(data["labels"])      # Shape: (N,)
         if not self.workspace:
             return False, "Mission not initialized"
 
+        files = self.get_snapshot()
+
         if checkpoint_id == "explore_data":
             # Check if user has read the data files (we trust they did)
-            readme = self.workspace / "data" / "readme.txt"
-            if readme.exists():
+            has_patterns = files.exists("data/patterns.json") or files.exists("data/patterns.npz")
+            if files.exists("data/readme.txt") and has_patterns:
                 return True, "Data files are ready to explore!"
             return False, "Data files not found"
 
         elif checkpoint_id == "load_patterns":
-            train_py = self.workspace / "train.py"
-            if not train_py.exists():
+            if not files.exists("train.py"):
                 return False, "Create train.py with your loading code"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if "numpy" in content or "np." in content:
                 if "patterns" in content.lower():
                     return True, "Loading code detected!"
             return False, "train.py should load patterns with numpy"
 
         elif checkpoint_id == "configure_art1":
-            train_py = self.workspace / "train.py"
-            if not train_py.exists():
+            if not files.exists("train.py"):
                 return False, "Create train.py first"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if "ART1" in content and "artlib" in content:
                 return True, "ART1 configuration found!"
             return False, "Import and configure ART1 from artlib"
 
         elif checkpoint_id == "train_model":
-            results_file = self.workspace / "results.json"
-            if not results_file.exists():
+            if not files.exists("results.json"):
                 return False, "Run your training and save results.json"
             try:
-                results = json.loads(results_file.read_text())
+                results = files.json("results.json")
                 purity = results.get("purity", 0)
                 if purity >= 0.8:
                     return True, f"Excellent! Purity: {purity:.1%}"
@@ -2,8 +2,11 @@
 
 from pathlib import Path
 import json
+from collections import Counter
+
 import numpy as np
 
+from foundry.engine.datasets import write_npy
 from foundry.engine.tiers import Tier
 from foundry.engine.base import (
     Mission,
@@ -63,6 +66,8 @@ The iterative workflow:
 
 Separation score measures how well clusters match ground truth labels.
 Perfect separation = each cluster contains only one true label (or only noise).
+Save each embedding's cluster id, in file order, as `cluster_assignments` in
+results.json - the validator scores those against the ground truth.
 
 ## Hints
 
@@ -92,11 +97,27 @@ MISSION_INFO = MissionInfo(
 )
 
 
+def separation_score(labels: np.ndarray, assignments: list) -> float:
+    """Fraction of samples sharing the dominant true label of their cluster."""
+    # JSON ids of any type; str() keeps unhashable ones from raising
+    pairs = Counter(zip(map(str, assignments), labels.tolist()))
+    dominant: dict[str, int] = {}
+    for (cluster, _), count in pairs.items():
+        dominant[cluster] = max(dominant.get(cluster, 0), count)
+    return sum(dominant.values()) / len(labels) if len(labels) else 0.0
+
+
 @register_mission
 class SignalNoiseMission(Mission):
     """Second mission teaching iterative refinement with FuzzyART."""
 
     info = MISSION_INFO
+    script = "train.py"
+    outputs = ("results.json",)
+    dataset_version = 3
+    dataset_params = {
+        "n_clusters": 5, "samples_per_cluster": 15, "n_noise": 25, "n_dims": 16, "seed": 42,
+    }
 
     def __init__(self):
         self.workspace: Path | None = None
@@ -107,24 +128,28 @@ class SignalNoiseMission(Mission):
                 description="Read the numpy data files",
                 hint="Use np.load() to read .npy files",
                 status=CheckpointStatus.AVAILABLE,
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="first_attempt",
                 title="First Attempt",
                 description="Run FuzzyART and create initial results",
                 hint="Import FuzzyART from artlib and run fit()",
+                inputs=["train.py", "results.json"],
             ),
             Checkpoint(
                 id="diagnose",
                 title="Diagnose Issues",
                 description="Add diagnostic output to understand clustering",
                 hint="Print cluster counts, check label distribution per cluster",
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="iterate_success",
                 title="Iterate to Success",
                 description="Achieve >75% separation score",
                 hint="Adjust rho - try values between 0.3 and 0.7",
+                inputs=["results.json"],
             ),
         ]
 
@@ -135,31 +160,32 @@ class SignalNoiseMission(Mission):
         data_dir = workspace / "data"
         data_dir.mkdir(exist_ok=True)
 
-        # Generate synthetic embeddings
-        embeddings, labels = self._generate_embeddings()
-        np.save(data_dir / "embeddings.npy", embeddings)
-        np.save(data_dir / "labels.npy", labels)
+        # Generated embeddings come from the shared dataset store
+        self.install_dataset(data_dir)
 
         # Write readme
-        readme = '''# Embedding Data Format
+        params = self.get_params()
+        n_samples = params["n_clusters"] * params["samples_per_cluster"] + params["n_noise"]
+        n_dims = params["n_dims"]
+        readme = f'''# Embedding Data Format
 
 ## Files
 
-- embeddings.npy: Shape (100, 16) - 100 samples, 16 dimensions
-- labels.npy: Shape (100,) - Ground truth labels
+- embeddings.npy: Shape ({n_samples}, {n_dims}) - {n_samples} samples, {n_dims} dimensions
+- labels.npy: Shape ({n_samples},) - Ground truth labels
 
 ## Labels
 
-- 0, 1, 2, 3, 4: Valid sensor cluster IDs
+- {", ".join(map(str, range(params["n_clusters"])))}: Valid sensor cluster IDs
 - -1: Corrupted/noise samples
-
+''' + '''
 ## Loading
 
 ```python
 import numpy as np
 
-embeddings = np.load("embeddings.npy")  # Shape: (100, 16)
-labels = np.load("labels.npy")          # Shape: (100,)
+embeddings = np.load("embeddings.npy")  # Shape: (samples, dimensions)
+labels = np.load("labels.npy")          # Shape: (samples,)
 
 print(f"Samples: {len(embeddings)}")
 print(f"Dimensions: {embeddings.shape[1]}")
@@ -228,7 +254,8 @@ def main():
     # TODO: Calculate separation score
 
     # TODO: Save results to results.json
-    # Required keys: "separation_score", "n_clusters"
+    # Required keys: "separation_score", "n_clusters",
+    # "cluster_assignments" (one cluster id per embedding, in file order)
 
 
 if __name__ == "__main__":
@@ -236,44 +263,66 @@ if __name__ == "__main__":
 '''
         (workspace / "train.py").write_text(starter)
 
-    def _generate_embeddings(self) -> tuple[np.ndarray, np.ndarray]:
-        """Generate synthetic embeddings with clusters and noise."""
-        rng = np.random.default_rng(42)
+    def check_params(self, params: dict) -> None:
+        """Reject cluster layouts the generator can't produce."""
+        for key in ("n_clusters", "samples_per_cluster", "n_dims"):
+            if params[key] < 1:
+                raise ValueError(f"{key} must be at least 1, got {params[key]}")
+        for key in ("n_noise", "seed"):
+            if params[key] < 0:
+                raise ValueError(f"{key} must be non-negative, got {params[key]}")
+
+    def build_dataset(self, data_dir: Path) -> None:
+        """Generate and save the synthetic embeddings."""
+        self._generate_embeddings(data_dir, **self.get_params())
+
+    def _generate_embeddings(
+        self,
+        data_dir: Path,
+        n_clusters: int = 5,
+        samples_per_cluster: int = 15,
+        n_noise: int = 25,
+        n_dims: int = 16,
+        seed: int = 42,
+    ) -> None:
+        """
+        Write synthetic embeddings with clusters and noise to data_dir.
+
+        The labels are shuffled first, then embeddings are generated chunk by
+        chunk, in parallel, straight into their final rows of a memory-mapped
+        .npy; each chunk has its own random stream, so the result does not
+        depend on the number of workers.
+        """
+        centers, labels = self._layout(n_clusters, samples_per_cluster, n_noise, n_dims, seed)
+        np.save(data_dir / "labels.npy", labels)
 
-        n_clusters = 5
-        samples_per_cluster = 15
-        n_noise = 25
-        n_dims = 16
+        def fill(start: int, stop: int, rng: np.random.Generator) -> np.ndarray:
+            chunk = labels[start:stop]
+            # Tight clusters with small variance around each center
+            samples = centers[chunk] + rng.normal(0, 0.05, size=(len(chunk), n_dims))
+            # Noise points scattered throughout
+            noise = chunk == -1
+            samples[noise] = rng.uniform(0, 1, size=(int(noise.sum()), n_dims))
+            return np.clip(samples, 0, 1)  # Keep in [0, 1]
 
-        embeddings = []
-        labels = []
+        write_npy(data_dir / "embeddings.npy", (len(labels), n_dims), np.float32, fill, seed)
+
+    @staticmethod
+    def _layout(
+        n_clusters: int, samples_per_cluster: int, n_noise: int, n_dims: int, seed: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Cluster centers and shuffled ground-truth labels of a dataset variant."""
+        rng = np.random.default_rng(seed)
 
         # Generate cluster centers
         centers = rng.uniform(0.2, 0.8, size=(n_clusters, n_dims))
 
-        # Generate samples around each center
-        for cluster_id in range(n_clusters):
-            center = centers[cluster_id]
-            # Tight clusters with small variance
-            samples = center + rng.normal(0, 0.05, size=(samples_per_cluster, n_dims))
-            samples = np.clip(samples, 0, 1)  # Keep in [0, 1]
-            embeddings.append(samples)
-            labels.extend([cluster_id] * samples_per_cluster)
-
-        # Generate noise points scattered throughout
-        noise = rng.uniform(0, 1, size=(n_noise, n_dims))
-        embeddings.append(noise)
-        labels.extend([-1] * n_noise)
-
-        embeddings = np.vstack(embeddings).astype(np.float32)
-        labels = np.array(labels)
-
-        # Shuffle
-        perm = rng.permutation(len(embeddings))
-        embeddings = embeddings[perm]
-        labels = labels[perm]
-
-        return embeddings, labels
+        # Cluster ids for tight groupings, -1 for noise points
+        labels = np.concatenate([
+            np.repeat(np.arange(n_clusters), samples_per_cluster),
+            np.full(n_noise, -1),
+        ])
+        return centers, rng.permutation(labels)
 
     def get_checkpoints(self) -> list[Checkpoint]:
         """Return list of mission checkpoints."""
@@ -284,31 +333,32 @@ if __name__ == "__main__":
         if not self.workspace:
             return False, "Mission not initialized"
 
-        train_py = self.workspace / "train.py"
-        results_file = self.workspace / "results.json"
+        files = self.get_snapshot()
+        has_train_py = files.exists("train.py")
+        has_results = files.exists("results.json")
 
         if checkpoint_id == "load_embeddings":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if "np.load" in content and "embeddings" in content.lower():
                 return True, "Data loading code detected!"
             return False, "Add np.load() to read the .npy files"
 
         elif checkpoint_id == "first_attempt":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if "FuzzyART" in content and "fit" in content:
-                if results_file.exists():
+                if has_results:
                     return True, "First attempt completed!"
                 return False, "Run your script and save results.json"
             return False, "Add FuzzyART initialization and fit()"
 
         elif checkpoint_id == "diagnose":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             # Look for diagnostic code: print statements, cluster analysis
             has_diagnostics = any(x in content for x in [
                 "print", "n_clusters", "unique", "Counter", "distribution"
@@ -318,16 +368,21 @@ if __name__ == "__main__":
             return False, "Add print statements to analyze your clusters"
 
         elif checkpoint_id == "iterate_success":
-            if not results_file.exists():
+            if not has_results:
                 return False, "Run training and save results.json"
             try:
-                results = json.loads(results_file.read_text())
-                score = results.get("separation_score", 0)
-                if score >= 0.75:
-                    return True, f"Excellent! Score: {score:.1%}"
-                return False, f"Score {score:.1%} - need >75%. Adjust parameters!"
+                results = files.json("results.json")
             except json.JSONDecodeError:
                 return False, "Invalid results.json format"
+            # Score against this workspace's own variant, not a reported number
+            _, labels = self._layout(**self.get_params())
+            assignments = results.get("cluster_assignments") if isinstance(results, dict) else None
+            if not isinstance(assignments, list) or len(assignments) != len(labels):
+                return False, f"Save cluster_assignments for all {len(labels)} embeddings in results.json"
+            score = separation_score(labels, assignments)
+            if score >= 0.75:
+                return True, f"Excellent! Score: {score:.1%}"
+            return False, f"Score {score:.1%} - need >75%. Adjust parameters!"
 
         return False, "Unknown checkpoint"
 
@@ -4,6 +4,7 @@ from pathlib import Path
 import json
 import numpy as np
 
+from foundry.engine.datasets import write_npy
 from foundry.engine.tiers import Tier
 from foundry.engine.base import (
     Mission,
@@ -40,7 +41,7 @@ workspace/
 │   ├── test_y.npy     # Test labels (50,)
 │   └── readme.txt
 ├── train.py           # Minimal starter - you fill in the rest
-└── results.json
+└── results.json       # "accuracy" and "predictions" (one per test sample)
 ```
 
 ## ARTMAP Concepts
@@ -111,6 +112,10 @@ class MappersPathMission(Mission):
     """Third mission teaching code generation with ARTMAP."""
 
     info = MISSION_INFO
+    script = "train.py"
+    outputs = ("results.json",)
+    dataset_version = 3
+    dataset_params = {"train_per_class": 25, "test_per_class": 12, "seed": 42}
 
     def __init__(self):
         self.workspace: Path | None = None
@@ -121,24 +126,28 @@ class MappersPathMission(Mission):
                 description="Read the train/test numpy files",
                 hint="Use np.load() for the 4 data files",
                 status=CheckpointStatus.AVAILABLE,
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="generate_code",
                 title="Generate the Code",
                 description="Create ARTMAP training code (use Claude!)",
                 hint="Ask: 'Write code to create SimpleARTMAP with FuzzyART'",
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="train_model",
                 title="Train the Model",
                 description="Fit the model on training data",
                 hint="model.fit(X_prepared, y_train)",
+                inputs=["train.py"],
             ),
             Checkpoint(
                 id="evaluate",
                 title="Evaluate",
                 description="Achieve >85% test accuracy",
-                hint="Compare predictions to test_y, save accuracy to results.json",
+                hint="Compare predictions to test_y, save accuracy and predictions to results.json",
+                inputs=["results.json"],
             ),
         ]
 
@@ -149,23 +158,22 @@ class MappersPathMission(Mission):
         data_dir = workspace / "data"
         data_dir.mkdir(exist_ok=True)
 
-        # Generate synthetic classification data
-        train_X, train_y, test_X, test_y = self._generate_classification_data()
-        np.save(data_dir / "train_X.npy", train_X)
-        np.save(data_dir / "train_y.npy", train_y)
-        np.save(data_dir / "test_X.npy", test_X)
-        np.save(data_dir / "test_y.npy", test_y)
+        # Generated train/test split comes from the shared dataset store
+        self.install_dataset(data_dir)
 
         # Write readme
-        readme = '''# Classification Data Format
+        params = self.get_params()
+        n_train = 4 * params["train_per_class"]
+        n_test = 4 * params["test_per_class"]
+        readme = f'''# Classification Data Format
 
 ## Files
 
-- train_X.npy: Training features, shape (100, 8)
-- train_y.npy: Training labels, shape (100,) - integers 0-3
-- test_X.npy: Test features, shape (50, 8)
-- test_y.npy: Test labels, shape (50,) - integers 0-3
-
+- train_X.npy: Training features, shape ({n_train}, 8)
+- train_y.npy: Training labels, shape ({n_train},) - integers 0-3
+- test_X.npy: Test features, shape ({n_test}, 8)
+- test_y.npy: Test labels, shape ({n_test},) - integers 0-3
+''' + '''
 ## Loading
 
 ```python
@@ -222,17 +230,62 @@ print(f"Test: {test_X.shape}")
 # 4. Train on training data
 # 5. Predict on test data
 # 6. Calculate accuracy
-# 7. Save results to results.json
+# 7. Save results to results.json: "accuracy", and "predictions" - the
+#    predicted class of every test sample, in file order
 '''
         (workspace / "train.py").write_text(starter)
 
-    def _generate_classification_data(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        """Generate synthetic classification data with 4 classes."""
-        rng = np.random.default_rng(42)
+    def check_params(self, params: dict) -> None:
+        """Reject split sizes the generator can't produce."""
+        for key in ("train_per_class", "test_per_class"):
+            if params[key] < 1:
+                raise ValueError(f"{key} must be at least 1, got {params[key]}")
+        if params["seed"] < 0:
+            raise ValueError(f"seed must be non-negative, got {params['seed']}")
+
+    def build_dataset(self, data_dir: Path) -> None:
+        """Generate and save the synthetic train/test split."""
+        self._generate_classification_data(data_dir, **self.get_params())
+
+    def _generate_classification_data(
+        self,
+        data_dir: Path,
+        train_per_class: int = 25,
+        test_per_class: int = 12,
+        seed: int = 42,
+    ) -> None:
+        """
+        Write synthetic classification data with 4 classes to data_dir.
+
+        Each split's labels are shuffled first and its features generated
+        chunk by chunk, in parallel, straight into their final rows of a
+        memory-mapped .npy. Chunks draw from their own random streams, so
+        the result does not depend on the number of workers.
+        """
+        centers, labels = self._layout(train_per_class, test_per_class, seed)
+        n_features = centers.shape[1]
+
+        # Training split first, then the test split (same noise level)
+        splits = zip(("train", "test"), np.random.SeedSequence(seed).spawn(2))
+        for split, split_seed in splits:
+            y = labels[split]
+            np.save(data_dir / f"{split}_y.npy", y)
+
+            def fill(start: int, stop: int, rng: np.random.Generator, y: np.ndarray = y) -> np.ndarray:
+                chunk = y[start:stop]
+                samples = centers[chunk] + rng.normal(0, 0.08, size=(len(chunk), n_features))
+                return np.clip(samples, 0, 1)
+
+            write_npy(data_dir / f"{split}_X.npy", (len(y), n_features), np.float32, fill, split_seed)
+
+    @staticmethod
+    def _layout(
+        train_per_class: int, test_per_class: int, seed: int
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Class centers and the shuffled train/test labels of a dataset variant."""
+        rng = np.random.default_rng(seed)
 
         n_classes = 4
-        train_per_class = 25
-        test_per_class = 12
         n_features = 8
 
         # Generate class centers spread across feature space
@@ -247,41 +300,11 @@ print(f"Test: {test_X.shape}")
             recessive = [(i * 2 + 4) % n_features, (i * 2 + 5) % n_features]
             centers[i, recessive] = 0.1 + rng.uniform(0, 0.2, size=2)
 
-        train_X, train_y = [], []
-        test_X, test_y = [], []
-
-        for class_id in range(n_classes):
-            center = centers[class_id]
-
-            # Training samples
-            samples = center + rng.normal(0, 0.08, size=(train_per_class, n_features))
-            samples = np.clip(samples, 0, 1)
-            train_X.append(samples)
-            train_y.extend([class_id] * train_per_class)
-
-            # Test samples (slightly different noise)
-            samples = center + rng.normal(0, 0.08, size=(test_per_class, n_features))
-            samples = np.clip(samples, 0, 1)
-            test_X.append(samples)
-            test_y.extend([class_id] * test_per_class)
-
-        # Combine and shuffle
-        train_X = np.vstack(train_X).astype(np.float32)
-        train_y = np.array(train_y)
-        test_X = np.vstack(test_X).astype(np.float32)
-        test_y = np.array(test_y)
-
-        # Shuffle training data
-        perm = rng.permutation(len(train_X))
-        train_X = train_X[perm]
-        train_y = train_y[perm]
-
-        # Shuffle test data
-        perm = rng.permutation(len(test_X))
-        test_X = test_X[perm]
-        test_y = test_y[perm]
-
-        return train_X, train_y, test_X, test_y
+        labels = {
+            split: rng.permutation(np.repeat(np.arange(n_classes), per_class))
+            for split, per_class in (("train", train_per_class), ("test", test_per_class))
+        }
+        return centers, labels
 
     def get_checkpoints(self) -> list[Checkpoint]:
         """Return list of mission checkpoints."""
@@ -292,21 +315,22 @@ print(f"Test: {test_X.shape}")
         if not self.workspace:
             return False, "Mission not initialized"
 
-        train_py = self.workspace / "train.py"
-        results_file = self.workspace / "results.json"
+        files = self.get_snapshot()
+        has_train_py = files.exists("train.py")
+        has_results = files.exists("results.json")
 
         if checkpoint_id == "load_data":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if "np.load" in content and "train_X" in content:
                 return True, "Data loading detected!"
             return False, "Load the numpy data files"
 
         elif checkpoint_id == "generate_code":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             has_artmap = "SimpleARTMAP" in content or "ARTMAP" in content
             has_fuzzy = "FuzzyART" in content
             if has_artmap and has_fuzzy:
@@ -314,24 +338,30 @@ print(f"Test: {test_X.shape}")
             return False, "Ask Claude to write SimpleARTMAP + FuzzyART code"
 
         elif checkpoint_id == "train_model":
-            if not train_py.exists():
+            if not has_train_py:
                 return False, "train.py not found"
-            content = train_py.read_text()
+            content = files.text("train.py")
             if ".fit(" in content and ("SimpleARTMAP" in content or "ARTMAP" in content):
                 return True, "Training code detected!"
             return False, "Add model.fit() call to train the model"
 
         elif checkpoint_id == "evaluate":
-            if not results_file.exists():
+            if not has_results:
                 return False, "Run training and save results.json"
             try:
-                results = json.loads(results_file.read_text())
-                accuracy = results.get("accuracy", 0)
-                if accuracy >= 0.85:
-                    return True, f"Excellent! Accuracy: {accuracy:.1%}"
-                return False, f"Accuracy {accuracy:.1%} - need >85%"
+                results = files.json("results.json")
             except json.JSONDecodeError:
                 return False, "Invalid results.json format"
+            # Score against this workspace's own test labels, not a reported number
+            _, labels = self._layout(**self.get_params())
+            test_y = labels["test"].tolist()
+            predictions = results.get("predictions") if isinstance(results, dict) else None
+            if not isinstance(predictions, list) or len(predictions) != len(test_y):
+                return False, f"Save predictions for all {len(test_y)} test samples in results.json"
+            accuracy = sum(p == y for p, y in zip(predictions, test_y)) / len(test_y) if test_y else 0.0
+            if accuracy >= 0.85:
+                return True, f"Excellent! Accuracy: {accuracy:.1%}"
+            return False, f"Accuracy {accuracy:.1%} - need >85%"
 
         return False, "Unknown checkpoint"
 
@@ -1,5 +1,6 @@
 """Terminal UI components."""
 
-from foundry.ui.display import show_welcome, show_status
+from foundry.ui.console import console, get_console
+from foundry.ui.display import show_welcome, show_status, show_leaderboard
 
-__all__ = ["show_welcome", "show_status"]
+__all__ = ["console", "get_console", "show_welcome", "show_status", "show_leaderboard"]
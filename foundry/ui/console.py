@@ -0,0 +1,32 @@
+"""Shared terminal console, created on first use.
+
+Importing Rich costs more than most commands take to run, so modules hold
+the lazy `console` proxy and only the first print actually imports Rich.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: "Console | None" = None
+
+
+def get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Forwards attribute access to the shared console."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
@@ -1,13 +1,8 @@
 """Terminal display components."""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
 from foundry.engine.state import GameState
 from foundry.engine.tiers import TIER_INFO, get_next_tier
-
-console = Console()
+from foundry.ui.console import console
 
 LOGO = """
 [bold cyan]
@@ -23,6 +18,8 @@ LOGO = """
 
 def show_welcome(state: GameState) -> None:
     """Display the welcome screen."""
+    from rich.panel import Panel
+
     console.print(LOGO)
     console.print(
         Panel(
@@ -61,6 +58,9 @@ def _show_quick_status(state: GameState) -> None:
 
 def show_status(state: GameState) -> None:
     """Display detailed player status."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     tier_info = TIER_INFO[state.tier]
 
     table = Table(title="Player Status", border_style="cyan")
@@ -84,3 +84,30 @@ def show_status(state: GameState) -> None:
         title=f"{state.tier.value} Tier",
         border_style="cyan",
     ))
+
+
+def show_leaderboard(rows: list[dict]) -> None:
+    """Display the top players."""
+    from rich.table import Table
+
+    if not rows:
+        console.print("[yellow]No players on the leaderboard yet.[/yellow]")
+        return
+
+    table = Table(title="Leaderboard", border_style="cyan")
+    table.add_column("#", style="bold")
+    table.add_column("Player")
+    table.add_column("Tier")
+    table.add_column("XP")
+    table.add_column("Missions")
+
+    for rank, row in enumerate(rows, start=1):
+        table.add_row(
+            str(rank),
+            f"{row['player_name']} [dim]({row['player_id']})[/dim]",
+            row["tier"],
+            str(row["xp"]),
+            str(row["missions"]),
+        )
+
+    console.print(table)
@@ -0,0 +1,60 @@
+"""Tests for the script-run cache."""
+
+import functools
+import json
+from types import SimpleNamespace
+
+from foundry.engine import cache, sandbox, zygote
+
+
+class FakeMission:
+    info = SimpleNamespace(id="fake")
+    script = "train.py"
+    outputs = ("results.json",)
+
+
+def test_cache_hit_removes_outputs_the_cached_run_did_not_produce(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "RunCache", functools.partial(cache.RunCache, root=tmp_path / "runs"))
+    monkeypatch.setattr(cache, "VERDICT_DIR", tmp_path / "verdicts")
+    monkeypatch.setattr(zygote, "ENABLED", False)
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "train.py").write_text("raise SystemExit(1)\n")
+
+    first = sandbox.run_mission_script(FakeMission(), workspace)
+    assert first.returncode == 1 and not first.cached
+
+    # A hand-written result must not survive a cached replay of the failed run
+    (workspace / "results.json").write_text(json.dumps({"accuracy": 0.99}))
+    second = sandbox.run_mission_script(FakeMission(), workspace)
+    assert second.cached and second.returncode == 1
+    assert not (workspace / "results.json").exists()
+
+
+def test_cache_hit_restores_produced_outputs(tmp_path):
+    runs = cache.RunCache(root=tmp_path / "runs")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "results.json").write_text('{"accuracy": 0.9}')
+    runs.put("k", workspace, ("results.json",), {"returncode": 0})
+
+    (workspace / "results.json").write_text('{"accuracy": 0.99}')
+    assert runs.restore("k", workspace, ("results.json",)) == {"returncode": 0}
+    assert json.loads((workspace / "results.json").read_text()) == {"accuracy": 0.9}
+
+
+def test_run_key_reuses_fingerprints_of_unchanged_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "VERDICT_DIR", tmp_path / "verdicts")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "train.py").write_text("print(1)\n")
+    runs = cache.RunCache(root=tmp_path / "runs")
+    fingerprints = cache.VerdictCache(FakeMission(), workspace)
+    key = runs.key(workspace, "train.py", (), "", fingerprints)
+    fingerprints.save()
+
+    hashed = []
+    monkeypatch.setattr(cache, "hash_file", lambda path: hashed.append(path))
+    fingerprints = cache.VerdictCache(FakeMission(), workspace)
+    assert runs.key(workspace, "train.py", (), "", fingerprints) == key
+    assert hashed == []
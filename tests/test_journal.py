@@ -0,0 +1,13 @@
+"""Tests for the event journal."""
+
+from foundry.engine.journal import Journal
+
+
+def test_append_after_torn_line_keeps_the_new_events(tmp_path):
+    journal = Journal(tmp_path / "events.jsonl", tmp_path / "snapshot.json")
+    journal.append([{"seq": 1, "type": "a"}])
+    with journal.path.open("a") as f:
+        f.write('{"seq":2,"ty')  # Crash part-way through an append
+
+    journal.append([{"seq": 3, "type": "c"}])
+    assert journal.read_events() == [{"seq": 1, "type": "a"}, {"seq": 3, "type": "c"}]